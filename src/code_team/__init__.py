@@ -5,9 +5,22 @@ This framework provides tools for planning, coding, and verifying software proje
 using AI agents and structured workflows.
 """
 
+from typing import TYPE_CHECKING, Any
+
 from .models.config import CodeTeamConfig
 from .models.plan import Plan
-from .orchestrator.orchestrator import Orchestrator
+
+if TYPE_CHECKING:
+    from .orchestrator.orchestrator import Orchestrator
 
 __version__ = "0.2.0"
 __all__ = ["CodeTeamConfig", "Plan", "Orchestrator"]
+
+
+def __getattr__(name: str) -> Any:
+    # The orchestrator pulls in the SDK, rich and Jinja; import it on first use
+    if name == "Orchestrator":
+        from .orchestrator.orchestrator import Orchestrator
+
+        return Orchestrator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,12 @@
 """Entry point for the Code Team Framework CLI."""
 
 import asyncio
+import sys
 from pathlib import Path
 
 import typer
 
-from code_team.orchestrator.orchestrator import Orchestrator
 from code_team.utils.init import check_initialization_status, initialize_project
-from code_team.utils.ui import interactive
 
 app = typer.Typer(help="Code Team Framework Orchestrator")
 
@@ -54,6 +53,9 @@ def plan(
     ),
 ) -> None:
     """Start or resume the planning phase."""
+    from code_team.orchestrator.orchestrator import Orchestrator
+    from code_team.utils.ui import interactive
+
     project_root = Path.cwd()
     config_path = project_root / config
 
@@ -72,6 +74,9 @@ def plan(
         print("\nProcess interrupted by user. Exiting.")
     except BaseException as e:
         print(f"\nAn unexpected error occurred: {e}")
+    finally:
+        orchestrator.display_cache_stats()
+        orchestrator.close()
 
 
 @app.command()
@@ -84,6 +89,8 @@ def code(
     ),
 ) -> None:
     """Start or resume the coding and verification loop."""
+    from code_team.orchestrator.orchestrator import Orchestrator
+
     project_root = Path.cwd()
     config_path = project_root / config
 
@@ -95,6 +102,9 @@ def code(
         print("\nProcess interrupted by user. Exiting.")
     except BaseException as e:
         print(f"\nAn unexpected error occurred: {e}")
+    finally:
+        orchestrator.display_cache_stats()
+        orchestrator.close()
 
 
 @app.command()
@@ -107,6 +117,8 @@ def dashboard(
     ),
 ) -> None:
     """Display a quick overview of the project's status."""
+    from code_team.orchestrator.orchestrator import Orchestrator
+
     project_root = Path.cwd()
     config_path = project_root / config
 
@@ -114,8 +126,20 @@ def dashboard(
     orchestrator.display_dashboard()
 
 
+def _install_uvloop() -> None:
+    """Use uvloop's event loop when it is installed (not available on Windows)."""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop  # type: ignore[import-not-found,unused-ignore]
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def main() -> None:
     """Main entry point for the Code Team Framework CLI."""
+    _install_uvloop()
     app()
 
 
@@ -0,0 +1,37 @@
+"""Bounded concurrency helpers for running independent agent calls together."""
+
+import asyncio
+from collections.abc import Awaitable, Iterable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+async def _bounded(semaphore: asyncio.Semaphore, awaitable: Awaitable[T]) -> T:
+    async with semaphore:
+        return await awaitable
+
+
+async def run_batch(
+    awaitables: Iterable[Awaitable[T]], limit: int
+) -> list[T | BaseException]:
+    """
+    Run independent agent calls concurrently, at most limit at once.
+
+    Args:
+        awaitables: The agent calls to run.
+        limit: The maximum number of calls in flight; must be at least 1.
+
+    Returns:
+        The results in input order. A call that raised contributes its exception
+        instead of aborting the rest of the batch.
+    """
+    if limit < 1:
+        raise ValueError(f"Concurrency limit must be at least 1, got {limit}")
+
+    # Created per batch so it is bound to the running event loop
+    semaphore = asyncio.Semaphore(limit)
+    return await asyncio.gather(
+        *(_bounded(semaphore, awaitable) for awaitable in awaitables),
+        return_exceptions=True,
+    )
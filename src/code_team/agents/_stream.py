@@ -0,0 +1,132 @@
+"""Type-dispatched handling of SDK stream messages for agent displays."""
+
+import json
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from claude_code_sdk import (
+    AssistantMessage,
+    Message,
+    ResultMessage,
+    TextBlock,
+    ToolUseBlock,
+)
+
+from code_team.utils.ui import escape_rich
+
+
+@dataclass
+class StreamState:
+    """Text and display lines accumulated while an agent's response streams in.
+
+    With to_transcript set, response text and tool calls are queued in
+    transcript_parts for the caller to write out, instead of being kept in
+    response_parts. The display then only keeps a bounded preview: text blocks
+    are shortened to preview_chars and only the last preview_lines lines are
+    retained. With displayed unset, no display lines are kept at all.
+    """
+
+    flush_chars: int = 512
+    displayed: bool = True
+    to_transcript: bool = False
+    preview_chars: int = 200
+    preview_lines: int = 200
+    response_parts: list[str] = field(default_factory=list)
+    transcript_parts: list[str] = field(default_factory=list)
+    display_lines: list[str] = field(default_factory=list)
+    pending_lines: list[str] = field(default_factory=list)
+    pending_chars: int = 0
+    flush_due: bool = False
+
+    def add_line(self, line: str, flush: bool = False) -> None:
+        """Queue a display line, requesting a redraw when flush is set or the buffer is full."""
+        if not self.displayed:
+            return
+        self.pending_lines.append(line)
+        self.pending_chars += len(line)
+        if flush or self.pending_chars >= self.flush_chars:
+            self.flush_due = True
+
+    def flush(self) -> None:
+        """Move queued lines to the displayed lines."""
+        self.display_lines.extend(self.pending_lines)
+        if self.to_transcript and len(self.display_lines) > self.preview_lines:
+            del self.display_lines[: -self.preview_lines]
+        self.pending_lines.clear()
+        self.pending_chars = 0
+        self.flush_due = False
+
+    def take_transcript(self) -> str:
+        """Return and clear the transcript text queued since the last call."""
+        text = "".join(self.transcript_parts)
+        self.transcript_parts.clear()
+        return text
+
+
+def _handle_text(block: TextBlock, state: StreamState) -> None:
+    if state.to_transcript:
+        state.transcript_parts.append(block.text)
+    else:
+        state.response_parts.append(block.text)
+    if text_content := block.text.strip():
+        if state.to_transcript and len(text_content) > state.preview_chars:
+            text_content = f"{text_content[: state.preview_chars]}…"
+        # Use rich's markup escaping for user-generated content
+        state.add_line(escape_rich(text_content))
+
+
+def _handle_tool(block: ToolUseBlock, state: StreamState) -> None:
+    if state.to_transcript:
+        state.transcript_parts.append(
+            f"\n[TOOL] {block.name}: {json.dumps(block.input)[:500]}\n"
+        )
+    state.add_line(
+        f"[bold yellow]↳ Tool Use:[/bold yellow] [bold magenta]{block.name}[/bold magenta]"
+    )
+    for key, value in block.input.items():
+        escaped_value = escape_rich(str(value))
+        state.add_line(f"  [green]{key}:[/green] {escaped_value[:200]}")
+    state.flush_due = True
+
+
+def _handle_assistant(message: AssistantMessage, state: StreamState) -> None:
+    for block in message.content:
+        if handler := _lookup(_BLOCK_HANDLERS, block):
+            handler(block, state)
+
+
+def _handle_result(message: ResultMessage, state: StreamState) -> None:
+    if message.is_error:
+        state.add_line(
+            f"[bold red]Result: Error ({message.subtype})[/bold red]", flush=True
+        )
+
+
+_MESSAGE_HANDLERS: dict[type, Callable[[Any, StreamState], None]] = {
+    AssistantMessage: _handle_assistant,
+    ResultMessage: _handle_result,
+}
+
+_BLOCK_HANDLERS: dict[type, Callable[[Any, StreamState], None]] = {
+    TextBlock: _handle_text,
+    ToolUseBlock: _handle_tool,
+}
+
+
+def _lookup(
+    handlers: dict[type, Callable[[Any, StreamState], None]], obj: object
+) -> Callable[[Any, StreamState], None] | None:
+    # Exact type hits the dict; subclasses and spec'd mocks fall back to isinstance
+    handler = handlers.get(type(obj))
+    if handler is None:
+        for cls, candidate in handlers.items():
+            if isinstance(obj, cls):
+                return candidate
+    return handler
+
+
+def handle_message(message: Message, state: StreamState) -> None:
+    """Record a streamed message in the state, ignoring message types with no display."""
+    if handler := _lookup(_MESSAGE_HANDLERS, message):
+        handler(message, state)
@@ -1,18 +1,14 @@
 import asyncio
+import contextlib
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
 from pathlib import Path
-from typing import Any
-
-from claude_code_sdk import (
-    AssistantMessage,
-    Message,
-    ResultMessage,
-    TextBlock,
-    ToolUseBlock,
-)
+from typing import Any, TextIO
+
+from claude_code_sdk import Message
 from rich.live import Live
 
+from code_team.agents import _stream
 from code_team.models.config import CodeTeamConfig
 from code_team.utils.exceptions import ExceptionGroup
 from code_team.utils.llm import LLMProvider
@@ -23,6 +19,9 @@ from code_team.utils.ui import display
 class Agent(ABC):
     """Abstract base class for all agents."""
 
+    # Buffered streamed text is redrawn once it reaches this many characters
+    _STREAM_FLUSH_CHARS = 512
+
     def __init__(
         self,
         llm_provider: LLMProvider,
@@ -52,61 +51,52 @@ class Agent(ABC):
         return self.config.llm.get_model_for_agent(snake_case)
 
     async def _stream_and_collect_response(
-        self, llm_stream: AsyncIterator[Message]
+        self,
+        llm_stream: AsyncIterator[Message],
+        transcript: TextIO | None = None,
+        live: bool = True,
     ) -> str:
         """
         Streams agent activity to the console and collects the final text response.
-        """
-        full_response_parts: list[str] = []
-        accumulated_content: list[str] = []
 
-        # Create initial panel with "thinking..." message
-        panel = display.create_agent_panel(self.name, "Thinking...")
+        When a transcript is given, response text and tool calls are written to
+        it from a worker thread as they arrive instead of being kept in memory,
+        and an empty string is returned. With live unset, the response is
+        collected without a Live panel; rich cannot show several Live displays
+        at once, so agents running concurrently must not each open one.
+        """
+        state = _stream.StreamState(
+            flush_chars=self._STREAM_FLUSH_CHARS,
+            to_transcript=transcript is not None,
+            displayed=live,
+        )
+
+        live_panel = None
+        if live:
+            # Create initial panel with "thinking..." message
+            panel = display.create_agent_panel(self.name, "Thinking...")
+            live_panel = Live(
+                panel, console=display.console, refresh_per_second=4, transient=False
+            )
+
+        with live_panel or contextlib.nullcontext():
+
+            def refresh() -> None:
+                state.flush()
+                if live_panel is not None:
+                    live_panel.update(
+                        display.create_scrollable_panel(self.name, state.display_lines)
+                    )
 
-        with Live(
-            panel, console=display.console, refresh_per_second=4, transient=False
-        ) as live:
             try:
                 async for message in llm_stream:
-                    if isinstance(message, AssistantMessage):
-                        for block in message.content:
-                            if isinstance(block, TextBlock):
-                                full_response_parts.append(block.text)
-                                if text_content := block.text.strip():
-                                    # Use rich's markup escaping for user-generated content
-                                    escaped_text = text_content.replace(
-                                        "[", "[["
-                                    ).replace("]", "]]")
-                                    accumulated_content.append(escaped_text)
-                                    # Update the panel with scrollable content
-                                    panel = display.create_scrollable_panel(
-                                        self.name, accumulated_content
-                                    )
-                                    live.update(panel)
-                            elif isinstance(block, ToolUseBlock):
-                                tool_text = f"[bold yellow]↳ Tool Use:[/bold yellow] [bold magenta]{block.name}[/bold magenta]"
-                                accumulated_content.append(tool_text)
-                                for key, value in block.input.items():
-                                    escaped_value = (
-                                        str(value).replace("[", "[[").replace("]", "]]")
-                                    )
-                                    accumulated_content.append(
-                                        f"  [green]{key}:[/green] {escaped_value[:200]}"
-                                    )
-                                # Update panel with scrollable content
-                                panel = display.create_scrollable_panel(
-                                    self.name, accumulated_content
-                                )
-                                live.update(panel)
-                    elif isinstance(message, ResultMessage) and message.is_error:
-                        error_text = (
-                            f"[bold red]Result: Error ({message.subtype})[/bold red]"
-                        )
-                        accumulated_content.append(error_text)
-                        panel = display.create_scrollable_panel(
-                            self.name, accumulated_content
+                    _stream.handle_message(message, state)
+                    if transcript is not None and state.transcript_parts:
+                        await asyncio.to_thread(
+                            transcript.write, state.take_transcript()
                         )
-                        live.update(panel)
+                    if state.flush_due:
+                        refresh()
             except ExceptionGroup as eg:
                 display.warning(
                     "Stream interrupted due to SDK error. Partial response collected."
@@ -118,16 +108,29 @@ class Agent(ABC):
             except Exception as e:
                 display.warning(f"Stream interrupted: {e}. Partial response collected.")
                 raise
+            finally:
+                if state.pending_lines:
+                    refresh()
 
-        collected_response = "".join(full_response_parts).strip()
+        collected_response = "".join(state.response_parts).strip()
         return collected_response
 
     async def _robust_llm_query(
-        self, prompt: str, system_prompt: str, allowed_tools: list[str] | None = None
+        self,
+        prompt: str,
+        system_prompt: str,
+        allowed_tools: list[str] | None = None,
+        use_cache: bool = False,
+        live: bool = True,
     ) -> str:
         """
         Performs an LLM query with robust error handling for TaskGroup and JSON errors.
+
+        When use_cache is set, identical requests are served from the
+        provider's response cache instead of reaching the SDK. With live unset,
+        the response is not streamed to a Live panel.
         """
+        query = self.llm.cached_query if use_cache else self.llm.query
         max_retries = 3
         for attempt in range(max_retries):
             try:
@@ -136,13 +139,13 @@ class Agent(ABC):
                         f"Retrying request (attempt {attempt + 1}/{max_retries})..."
                     )
 
-                llm_stream = self.llm.query(
+                llm_stream = query(
                     prompt=prompt,
                     system_prompt=system_prompt,
                     allowed_tools=allowed_tools,
                     model=self._get_model(),
                 )
-                return await self._stream_and_collect_response(llm_stream)
+                return await self._stream_and_collect_response(llm_stream, live=live)
             except ExceptionGroup:
                 display.warning(
                     f"Attempt {attempt + 1}/{max_retries} failed with TaskGroup error"
@@ -160,6 +163,15 @@ class Agent(ABC):
 
         return self._get_fallback_response(prompt)
 
+    async def _cached_query(self, prompt: str, system_prompt: str) -> str:
+        """
+        Performs a robust LLM query backed by the response cache.
+
+        Only use this for agents whose output is fully determined by the prompts
+        and which have no side effects on the project.
+        """
+        return await self._robust_llm_query(prompt, system_prompt, use_cache=True)
+
     async def _render_and_query(
         self, template_name: str, prompt: str, **kwargs: Any
     ) -> str:
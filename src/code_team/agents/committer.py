@@ -1,6 +1,13 @@
+import re
+
 from code_team.agents.base import Agent
 from code_team.models.plan import Task
 
+_CODE_FENCE_RE = re.compile(r"```[^\n]*\n(.*?)```", re.DOTALL)
+_CONVENTIONAL_SUBJECT_RE = re.compile(
+    r"^(feat|fix|chore|docs|refactor|test|perf|build|ci|style)(\([^)]+\))?!?: \S"
+)
+
 
 class Committer(Agent):
     """Generates a conventional commit message for a completed task."""
@@ -15,6 +22,10 @@ class Committer(Agent):
         Returns:
             A formatted commit message string.
         """
+        # Descriptions already written as a conventional commit need no LLM call
+        if _CONVENTIONAL_SUBJECT_RE.match(task.description):
+            return f"{task.description.strip()}\n\nCloses: {task.id}"
+
         system_prompt = self.templates.render(
             "COMMIT_INSTRUCTIONS.md",
             TASK_ID=task.id,
@@ -22,22 +33,12 @@ class Committer(Agent):
         )
         prompt = "Generate the commit message."
 
-        commit_message = await self._robust_llm_query(
+        commit_message = await self._cached_query(
             prompt=prompt, system_prompt=system_prompt
         )
 
-        # Clean the message: remove potential code blocks and surrounding text
-        if "```" in commit_message:
-            # Simple extraction if it uses code blocks
-            lines = commit_message.split("\n")
-            core_message_lines = []
-            in_block = False
-            for line in lines:
-                if line.strip().startswith("```"):
-                    in_block = not in_block
-                    continue
-                if in_block:
-                    core_message_lines.append(line)
-            commit_message = "\n".join(core_message_lines)
+        # Clean the message: keep only the content of a fenced code block
+        if match := _CODE_FENCE_RE.search(commit_message):
+            commit_message = match.group(1)
 
         return commit_message.strip()
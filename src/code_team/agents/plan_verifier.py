@@ -15,6 +15,9 @@ class PlanVerifier(Agent):
         Returns:
             A string containing the verification feedback.
         """
+        if not plan_content.strip():
+            return "Plan is empty."
+
         system_prompt = self.templates.render("PLAN_VERIFIER_INSTRUCTIONS.md")
         prompt = f"""
         Here is the plan to verify:
@@ -32,8 +35,6 @@ class PlanVerifier(Agent):
         Please perform a critical review and provide your feedback in the specified format.
         """
 
-        feedback = await self._robust_llm_query(
-            prompt=prompt, system_prompt=system_prompt
-        )
+        feedback = await self._cached_query(prompt=prompt, system_prompt=system_prompt)
 
         return feedback.strip()
@@ -1,13 +1,20 @@
+import asyncio
 from typing import Any
 
 from code_team.agents.base import Agent
+from code_team.agents.summarizer import Summarizer
 from code_team.utils import parsing
-from code_team.utils.ui import display, interactive
+from code_team.utils.ui import ask_async, display, interactive
 
 
 class Planner(Agent):
     """Collaborates with the user to create a detailed implementation plan."""
 
+    # Older turns are summarized once the history exceeds twice this many
+    # exchanges; the most recent entries are always kept verbatim.
+    _HISTORY_WINDOW = 8
+    _KEEP_RECENT = 4
+
     async def run(self, **kwargs: Any) -> dict[str, str]:
         """
         Runs an interactive planning session with the user.
@@ -36,31 +43,84 @@ class Planner(Agent):
         conversation_history = [f"User request: {initial_request}"]
         prompt = initial_request
 
-        while True:
-            system_prompt = self.templates.render(
-                "PLANNER_INSTRUCTIONS.md", PLAN_ID=plan_id or "unknown"
-            )
-            full_prompt = (
-                "\n".join(conversation_history) + f"\n\nPlanner (to user): {prompt}"
-            )
-
-            response_text = await self._get_planner_response(system_prompt, full_prompt)
-
-            # Check if response contains the file separator (plan generation)
-            if "===FILE_SEPARATOR===" in response_text:
-                return self._parse_plan_files(response_text)
-
-            display.agent_thought("Planner", response_text)
-
-            user_input = interactive.get_text_input("You").strip()
+        system_prompt = self.templates.render(
+            "PLANNER_INSTRUCTIONS.md", PLAN_ID=plan_id or "unknown"
+        )
 
-            conversation_history.append(f"Planner: {response_text}")
-            conversation_history.append(f"User: {user_input}")
-            prompt = user_input  # Next prompt is just the user's latest message
+        summary_task: asyncio.Task[str] | None = None
+        summarized_upto = 0
+
+        try:
+            while True:
+                if summary_task is not None and summary_task.done():
+                    conversation_history = self._apply_summary(
+                        conversation_history, summary_task, summarized_upto
+                    )
+                    summary_task = None
+
+                full_prompt = (
+                    "\n".join(conversation_history) + f"\n\nPlanner (to user): {prompt}"
+                )
+
+                response_text = await self._get_planner_response(
+                    system_prompt, full_prompt
+                )
+
+                # Check if response contains the file separator (plan generation)
+                if "===FILE_SEPARATOR===" in response_text:
+                    return self._parse_plan_files(response_text)
+
+                display.agent_thought("Planner", response_text)
+
+                user_input = (
+                    await ask_async(interactive.get_text_input, "You")
+                ).strip()
+
+                conversation_history.append(f"Planner: {response_text}")
+                conversation_history.append(f"User: {user_input}")
+                prompt = user_input  # Next prompt is just the user's latest message
+
+                if (
+                    summary_task is None
+                    and len(conversation_history) > 2 * self._HISTORY_WINDOW
+                ):
+                    # Keep the original request; condense everything up to the
+                    # most recent turns while the conversation carries on
+                    summarized_upto = len(conversation_history) - self._KEEP_RECENT
+                    summary_task = asyncio.create_task(
+                        self._summarize(conversation_history[1:summarized_upto])
+                    )
+        finally:
+            if summary_task is not None:
+                summary_task.cancel()
+
+    async def _summarize(self, lines: list[str]) -> str:
+        """Summarizes part of the conversation with the Summarizer agent."""
+        summarizer = Summarizer(
+            self.llm, self.templates, self.config, self.project_root
+        )
+        return await summarizer.run(transcript="\n".join(lines))
+
+    def _apply_summary(
+        self,
+        history: list[str],
+        summary_task: asyncio.Task[str],
+        summarized_upto: int,
+    ) -> list[str]:
+        """Replaces the summarized turns with the summary, if one was produced."""
+        try:
+            summary = summary_task.result()
+        except Exception as e:
+            display.warning(f"Could not summarize the conversation: {e}")
+            return history
+
+        if not summary:
+            return history
+        return [history[0], f"[SUMMARY] {summary}", *history[summarized_upto:]]
 
     async def _get_planner_response(self, system_prompt: str, prompt: str) -> str:
         """Gets a single response from the LLM with robust error handling."""
-        return await self._robust_llm_query(prompt=prompt, system_prompt=system_prompt)
+        return await self._cached_query(prompt=prompt, system_prompt=system_prompt)
 
     def _parse_plan_files(self, response_text: str) -> dict[str, str]:
         """Parses the plan files from the response text."""
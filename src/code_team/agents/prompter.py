@@ -22,13 +22,13 @@ class Prompter(Agent):
         system_prompt = self.templates.render("PROMPTER_INSTRUCTIONS.md")
         prompt = f"Generate the coder prompt for this task:\nID: {task.id}\nDescription: {task.description}"
 
-        coder_prompt = await self._robust_llm_query(
+        coder_prompt = await self._cached_query(
             prompt=prompt, system_prompt=system_prompt
         )
 
         # Save the prompt to a file in the plan directory
         plan_dir = self.project_root / self.config.paths.plan_dir / plan_id
         prompt_file = plan_dir / f"{task.id}-prompt.md"
-        filesystem.write_file(prompt_file, coder_prompt)
+        await filesystem.write_file_async(prompt_file, coder_prompt)
 
         return prompt_file
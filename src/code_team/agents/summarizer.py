@@ -0,0 +1,31 @@
+from code_team.agents.base import Agent
+
+
+class Summarizer(Agent):
+    """Condenses conversation history into a short summary."""
+
+    async def run(self, transcript: str) -> str:  # type: ignore[override]
+        """
+        Summarizes a conversation transcript.
+
+        Runs without a live display so it can work in the background while
+        another agent owns the console. The response cache is never used: a
+        summary is derived from the current history and is not replayed.
+
+        Args:
+            transcript: The conversation lines to condense.
+
+        Returns:
+            A one-paragraph summary, or an empty string if none was produced.
+        """
+        system_prompt = self.templates.render("SUMMARIZER_INSTRUCTIONS.md")
+        prompt = f"Summarize this conversation:\n\n{transcript}"
+
+        parts = [
+            text
+            async for text in self.llm.query_text(
+                prompt=prompt, system_prompt=system_prompt, model=self._get_model()
+            )
+        ]
+
+        return "".join(parts).strip()
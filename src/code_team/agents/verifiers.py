@@ -31,23 +31,25 @@ class CodeVerifier(Agent):
         """Returns the verifier's specific name including type."""
         return f"{self.__class__.__name__} ({self.verifier_type})"
 
-    async def run(self, task: Task, diff: str) -> str:  # type: ignore[override]
+    @staticmethod
+    def build_prompt(task: Task, diff: str) -> str:
         """
-        Runs the verifier on the provided code changes.
+        Builds the user prompt asking for a review of a task's changes.
+
+        The prompt does not depend on the verifier type, so it can be built
+        once and shared by every verifier reviewing the same diff.
 
         Args:
             task: The task that was just completed.
             diff: The git diff of the changes made.
 
         Returns:
-            A formatted PASS/FAIL report.
+            The user prompt for the verifiers.
         """
-        system_prompt = self.templates.render(
-            self.instruction_file,
-            TASK_ID=task.id,
-            TASK_DESCRIPTION=task.description,
-        )
-        prompt = f"""
+        return f"""
+        Task ID: {task.id}
+        Task Description: {task.description}
+
         Here are the code changes to review for task '{task.id}':
 
         ```diff
@@ -57,8 +59,35 @@ class CodeVerifier(Agent):
         Please provide your verification report in the specified PASS/FAIL format.
         """
 
+    async def run(  # type: ignore[override]
+        self,
+        task: Task,
+        diff: str = "",
+        prompt: str | None = None,
+        live: bool = True,
+    ) -> str:
+        """
+        Runs the verifier on the provided code changes.
+
+        Args:
+            task: The task that was just completed.
+            diff: The git diff of the changes made.
+            prompt: A user prompt already built with build_prompt. When given,
+                diff is ignored.
+            live: Whether to stream the review to a Live panel. Disable this
+                when other verifiers run at the same time.
+
+        Returns:
+            A formatted PASS/FAIL report.
+        """
+        # The instructions are the same for every task; task details go in the
+        # user prompt so the system prompt stays identical across calls.
+        system_prompt = self.templates.render(self.instruction_file)
+        if prompt is None:
+            prompt = self.build_prompt(task, diff)
+
         report = await self._robust_llm_query(
-            prompt=prompt, system_prompt=system_prompt
+            prompt=prompt, system_prompt=system_prompt, live=live
         )
 
         return report.strip()
@@ -1,6 +1,7 @@
 """Models for the Code Team Framework."""
 
 from .config import (
+    CacheConfig,
     CodeTeamConfig,
     LLMConfig,
     PathConfig,
@@ -13,6 +14,7 @@ from .config import (
 from .plan import Plan, Task, TaskStatus
 
 __all__ = [
+    "CacheConfig",
     "CodeTeamConfig",
     "LLMConfig",
     "PathConfig",
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -17,6 +19,7 @@ class LLMConfig(BaseModel):
     verifier_sec: str = "sonnet"
     verifier_perf: str = "sonnet"
     commit_agent: str = "sonnet"
+    summarizer: str = "haiku"
 
     def get_model_for_agent(self, agent_name: str) -> str:
         """Get the model to use for a specific agent.
@@ -47,6 +50,10 @@ class VerificationConfig(BaseModel):
         default_factory=list[VerificationCommand]
     )
     metrics: VerificationMetrics = Field(default_factory=VerificationMetrics)
+    # Per-command and per-verifier time limit in seconds; None disables it
+    timeout_seconds: float | None = 600.0
+    # Maximum number of verifier agents running at the same time
+    max_concurrency: int = Field(default=5, ge=1)
 
 
 class VerifierInstances(BaseModel):
@@ -64,6 +71,9 @@ class PathConfig(BaseModel):
     config_dir: str = ".codeteam"
     agent_instructions_dir: str = ".codeteam/agent_instructions"
     template_dir: str = ".codeteam/agent_instructions"
+    cache_dir: str = ".codeteam/cache"
+    template_cache_dir: str = ".codeteam/jinja_cache"
+    log_dir: str = ".codeteam/logs"
 
 
 class TemplateConfig(BaseModel):
@@ -91,10 +101,24 @@ class TemplateConfig(BaseModel):
     )
 
 
+class CacheConfig(BaseModel):
+    """Configuration for the LLM response cache."""
+
+    # Off by default: with it on, re-running an agent on the same input replays
+    # the earlier answer instead of asking for a fresh one
+    enabled: bool = False
+    # Persistent store behind the in-memory LRU: one JSON file per entry or a
+    # single SQLite database
+    backend: Literal["json", "sqlite"] = "json"
+    ttl_seconds: int = 86400
+    max_memory_entries: int = 256
+
+
 class CodeTeamConfig(BaseModel):
-    version: float = 1.0
+    version: int = 1
     llm: LLMConfig = Field(default_factory=LLMConfig)
     verification: VerificationConfig = Field(default_factory=VerificationConfig)
     verifier_instances: VerifierInstances = Field(default_factory=VerifierInstances)
     paths: PathConfig = Field(default_factory=PathConfig)
     templates: TemplateConfig = Field(default_factory=TemplateConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
@@ -1,13 +1,14 @@
 import asyncio
 import os
-import subprocess
+import shlex
+from collections import deque
 from pathlib import Path
 
-import yaml
 from rich.live import Live
 from rich.progress import Progress, TaskID
 from rich.table import Table
 
+from code_team.agents import _concurrency
 from code_team.agents.base import Agent
 from code_team.agents.coder import Coder
 from code_team.agents.committer import Committer
@@ -15,11 +16,23 @@ from code_team.agents.plan_verifier import PlanVerifier
 from code_team.agents.planner import Planner
 from code_team.agents.prompter import Prompter
 from code_team.agents.verifiers import CodeVerifier
-from code_team.models.config import CodeTeamConfig
+from code_team.models.config import CodeTeamConfig, VerificationCommand
 from code_team.models.plan import Plan, Task
+from code_team.orchestrator.scheduler import TaskScheduler
 from code_team.orchestrator.state import OrchestratorState
-from code_team.utils import filesystem, git, llm, templates
-from code_team.utils.ui import display, interactive
+from code_team.utils import (
+    filesystem,
+    git,
+    llm,
+    llm_cache,
+    templates,
+    yaml_cache,
+)
+from code_team.utils.ui import ask_async, display, interactive
+
+# Only the tail of a verification command's output is kept for the report
+_OUTPUT_TAIL_LINES = 4096
+_OUTPUT_LINE_LIMIT = 1 << 20
 
 
 class Orchestrator:
@@ -31,26 +44,80 @@ class Orchestrator:
         self.state = OrchestratorState.IDLE
         self.plan_dir = self.project_root / self.config.paths.plan_dir
         self.report_dir = self.project_root / self.config.paths.report_dir
+        self._ensure_dirs_exist()
 
-        self.llm_provider = llm.LLMProvider(self.config.llm, str(project_root))
+        self.llm_cache = self._create_llm_cache()
+        self.llm_provider = llm.LLMProvider(
+            self.config.llm,
+            str(project_root),
+            cache=self.llm_cache,
+        )
         self.template_manager = templates.TemplateManager(
             project_root / self.config.paths.template_dir,
             project_root=project_root,
             guideline_files=self.config.templates.guideline_files,
             exclude_dirs=self.config.templates.exclude_dirs,
+            bytecode_cache_dir=project_root / self.config.paths.template_cache_dir,
         )
-
-        self._ensure_dirs_exist()
+        self.template_manager.precompile()
+        # Agents hold no per-run state, so one instance of each is reused
+        self._agents: dict[type[Agent], Agent] = {}
+        self._verifiers: dict[str, CodeVerifier] = {}
+        self._active_verifiers = [
+            verifier_type
+            for verifier_type, count in self.config.verifier_instances.model_dump().items()
+            if count > 0
+        ]
 
     def _load_config(self, path: Path) -> CodeTeamConfig:
-        content = filesystem.read_file(path)
-        if not content:
+        try:
+            config_data = yaml_cache.load_yaml(path)
+        except FileNotFoundError:
+            config_data = None
+        if not config_data:
             raise FileNotFoundError("Config file not found.")
-        return CodeTeamConfig.model_validate(yaml.safe_load(content))
+        return CodeTeamConfig.model_validate(config_data)
+
+    def _create_llm_cache(self) -> llm_cache.LLMCache | None:
+        """Builds the response cache: an in-memory LRU backed by a disk store."""
+        cache_config = self.config.cache
+        if not cache_config.enabled:
+            return None
+
+        cache_dir = self.project_root / self.config.paths.cache_dir
+        disk_backend: llm_cache.CacheBackend
+        if cache_config.backend == "sqlite":
+            disk_backend = llm_cache.SQLiteCacheBackend(cache_dir / "responses.db")
+        else:
+            disk_backend = llm_cache.JSONFileCacheBackend(cache_dir)
+        backend = llm_cache.TieredCacheBackend(
+            llm_cache.MemoryCacheBackend(cache_config.max_memory_entries),
+            disk_backend,
+        )
+        return llm_cache.LLMCache(backend, ttl=cache_config.ttl_seconds)
+
+    def display_cache_stats(self) -> None:
+        """Display how many LLM requests were served from the response cache."""
+        if self.llm_cache is None:
+            return
+
+        hits = self.llm_cache.stats["hits"]
+        misses = self.llm_cache.stats["misses"]
+        if hits or misses:
+            display.info(f"LLM cache: {hits} hit(s), {misses} miss(es)")
+
+    def close(self) -> None:
+        """Release resources held for the session, such as the cache database."""
+        if self.llm_cache is not None:
+            self.llm_cache.close()
 
     def _ensure_dirs_exist(self) -> None:
         self.plan_dir.mkdir(parents=True, exist_ok=True)
         self.report_dir.mkdir(parents=True, exist_ok=True)
+        filesystem.ensure_ignored_dir(self.project_root / self.config.paths.cache_dir)
+        filesystem.ensure_ignored_dir(
+            self.project_root / self.config.paths.template_cache_dir
+        )
 
     def _create_agent(self, agent_class: type[Agent]) -> Agent:
         """Factory method to create agents with consistent configuration."""
@@ -58,11 +125,31 @@ class Orchestrator:
             self.llm_provider, self.template_manager, self.config, self.project_root
         )
 
+    def _get_agent(self, agent_class: type[Agent]) -> Agent:
+        """Returns the shared instance of an agent class, creating it on first use."""
+        agent = self._agents.get(agent_class)
+        if agent is None:
+            agent = self._agents[agent_class] = self._create_agent(agent_class)
+        return agent
+
+    def _get_verifier(self, verifier_type: str) -> CodeVerifier:
+        """Returns the shared CodeVerifier for a verifier type."""
+        verifier = self._verifiers.get(verifier_type)
+        if verifier is None:
+            verifier = self._verifiers[verifier_type] = CodeVerifier(
+                verifier_type,
+                self.llm_provider,
+                self.template_manager,
+                self.config,
+                self.project_root,
+            )
+        return verifier
+
     async def run_plan_phase(self, initial_request: str) -> None:
         """Runs the planning phase of the workflow."""
         self.state = OrchestratorState.PLANNING_DRAFTING
         plan_id = f"plan-{len(list(self.plan_dir.iterdir())) + 1:04d}"
-        planner = self._create_agent(Planner)
+        planner = self._get_agent(Planner)
         plan_files = await planner.run(initial_request=initial_request, plan_id=plan_id)
 
         if not plan_files:
@@ -73,8 +160,10 @@ class Orchestrator:
         current_plan_dir = self.plan_dir / plan_id
         current_plan_dir.mkdir()
 
-        filesystem.write_file(current_plan_dir / "plan.yml", plan_files["plan.yml"])
-        filesystem.write_file(
+        await filesystem.write_file_async(
+            current_plan_dir / "plan.yml", plan_files["plan.yml"]
+        )
+        await filesystem.write_file_async(
             current_plan_dir / "ACCEPTANCE_CRITERIA.md",
             plan_files["ACCEPTANCE_CRITERIA.md"],
         )
@@ -87,7 +176,8 @@ class Orchestrator:
 
         # Simple interactive loop for plan review
         while self.state == OrchestratorState.PLANNING_AWAITING_REVIEW:
-            user_input = interactive.get_menu_choice(
+            user_input = await ask_async(
+                interactive.get_menu_choice,
                 "Review the plan and choose an action:",
                 ["Accept plan", "Discuss revisions with Planner", "Run Plan Verifier"],
             )
@@ -104,8 +194,9 @@ class Orchestrator:
         self.state = OrchestratorState.PLANNING_DRAFTING
 
         # Get user feedback for revision
-        revision_request = interactive.get_text_input(
-            "Describe what you'd like to revise about the plan:"
+        revision_request = await ask_async(
+            interactive.get_text_input,
+            "Describe what you'd like to revise about the plan:",
         )
 
         if not revision_request.strip():
@@ -114,7 +205,7 @@ class Orchestrator:
             return
 
         # Re-run planner with revision request
-        planner = self._create_agent(Planner)
+        planner = self._get_agent(Planner)
         plan_files = await planner.run(
             initial_request=revision_request, plan_id=plan_dir.name
         )
@@ -125,8 +216,8 @@ class Orchestrator:
             return
 
         # Update the existing plan files
-        filesystem.write_file(plan_dir / "plan.yml", plan_files["plan.yml"])
-        filesystem.write_file(
+        await filesystem.write_file_async(plan_dir / "plan.yml", plan_files["plan.yml"])
+        await filesystem.write_file_async(
             plan_dir / "ACCEPTANCE_CRITERIA.md",
             plan_files["ACCEPTANCE_CRITERIA.md"],
         )
@@ -136,17 +227,17 @@ class Orchestrator:
 
     async def _verify_plan(self, plan_dir: Path) -> None:
         self.state = OrchestratorState.PLANNING_VERIFYING
-        verifier = self._create_agent(PlanVerifier)
+        verifier = self._get_agent(PlanVerifier)
 
-        plan_content = filesystem.read_file(plan_dir / "plan.yml") or ""
+        plan_content = await filesystem.read_file_async(plan_dir / "plan.yml") or ""
         criteria_content = (
-            filesystem.read_file(plan_dir / "ACCEPTANCE_CRITERIA.md") or ""
+            await filesystem.read_file_async(plan_dir / "ACCEPTANCE_CRITERIA.md") or ""
         )
 
         feedback = await verifier.run(
             plan_content=plan_content, acceptance_criteria=criteria_content
         )
-        filesystem.write_file(plan_dir / "FEEDBACK.md", feedback)
+        await filesystem.write_file_async(plan_dir / "FEEDBACK.md", feedback)
 
         display.panel(feedback, title="Plan Verification Feedback")
 
@@ -155,7 +246,7 @@ class Orchestrator:
 
     async def run_code_phase(self) -> None:
         """Runs the main coding and verification loop."""
-        plan = self._select_plan_interactively()
+        plan = await self._select_plan_interactively()
         if not plan:
             display.error("No plan selected. Please run the planning phase first.")
             return
@@ -184,13 +275,14 @@ class Orchestrator:
                 total=3,  # prompting, coding, verifying
             )
 
+            scheduler = TaskScheduler(plan)
             self.state = OrchestratorState.CODING_AWAITING_TASK_SELECTION
             while self.state not in [
                 OrchestratorState.PLAN_COMPLETE,
                 OrchestratorState.HALTED_FOR_ERROR,
             ]:
-                task_id = self._select_next_task(plan)
-                if task_id == "PLAN_COMPLETE":
+                task = self._select_next_task(scheduler)
+                if task is None:
                     self.state = OrchestratorState.PLAN_COMPLETE
                     progress.update(overall_task, completed=total_tasks)
                     progress.update(
@@ -201,12 +293,6 @@ class Orchestrator:
                     display.success("🎉 Plan complete! All tasks have been finished.")
                     break
 
-                task = next((t for t in plan.tasks if t.id == task_id), None)
-                if not task:
-                    self.state = OrchestratorState.HALTED_FOR_ERROR
-                    display.error(f"Task '{task_id}' not found in plan.")
-                    break
-
                 # Reset current task progress
                 progress.update(
                     current_task,
@@ -215,17 +301,17 @@ class Orchestrator:
                 )
 
                 await self._execute_task_cycle(plan, task, progress, current_task)
+                if task.status == "completed":
+                    scheduler.mark_completed(task)
 
                 # Update overall progress
-                completed_count = len(
-                    [t for t in plan.tasks if t.status == "completed"]
-                )
-                progress.update(overall_task, completed=completed_count)
+                progress.update(overall_task, completed=len(scheduler.completed_ids))
 
-                # Reload plan to get updated task statuses
-                plan = self._get_latest_plan()
-                if not plan:
-                    break
+        # Fold the task statuses journaled during the phase into plan.yml. Without
+        # a journal no status has changed since plan.yml was last written.
+        plan_path = self.plan_dir / plan.plan_id / "plan.yml"
+        if filesystem.status_journal_path(plan_path).exists():
+            await asyncio.to_thread(filesystem.save_plan, plan_path, plan)
 
     async def _execute_task_cycle(
         self, plan: Plan, task: Task, progress: Progress, current_task_id: TaskID
@@ -238,7 +324,7 @@ class Orchestrator:
         # Load existing feedback from previous attempts if available
         report_file = self.report_dir / plan.plan_id / f"{task.id}.md"
         if report_file.exists():
-            existing_report = filesystem.read_file(report_file) or ""
+            existing_report = await filesystem.read_file_async(report_file) or ""
             if existing_report.strip():
                 verification_feedback = (
                     f"--- Previous Verification Report ---\n{existing_report}"
@@ -255,7 +341,7 @@ class Orchestrator:
                 completed=0,
             )
 
-            prompter = self._create_agent(Prompter)
+            prompter = self._get_agent(Prompter)
             prompt_file_path = await prompter.run(task=task, plan_id=plan.plan_id)
             progress.update(current_task_id, completed=1)
 
@@ -263,7 +349,8 @@ class Orchestrator:
             display.info(
                 f"Prompter has generated the instructions for the Coder. Please review the file: {prompt_file_path}"
             )
-            user_choice = interactive.get_menu_choice(
+            user_choice = await ask_async(
+                interactive.get_menu_choice,
                 "Proceed with these instructions?",
                 ["Proceed", "Edit instructions manually and then proceed"],
             )
@@ -271,7 +358,7 @@ class Orchestrator:
             # User can edit the file manually if they choose to
             if user_choice == "Edit instructions manually and then proceed":
                 display.info("Please edit the prompt file and press Enter when ready.")
-                input()
+                await ask_async(input)
 
             self.state = OrchestratorState.CODING_IN_PROGRESS
             progress.update(
@@ -280,7 +367,7 @@ class Orchestrator:
                 completed=1,
             )
 
-            coder = self._create_agent(Coder)
+            coder = self._get_agent(Coder)
             # Pass the feedback from the previous loop iteration (if any)
             await coder.run(
                 coder_prompt=prompt_file_path,
@@ -301,10 +388,7 @@ class Orchestrator:
             progress.update(current_task_id, completed=3)
 
             # Save verification report to file
-            report_dir = self.report_dir / plan.plan_id
-            report_dir.mkdir(parents=True, exist_ok=True)
-            report_file = report_dir / f"{task.id}.md"
-            filesystem.write_file(report_file, verification_report)
+            await filesystem.write_file_async(report_file, verification_report)
 
             self.state = OrchestratorState.AWAITING_VERIFICATION_REVIEW
             display.panel(verification_report, title="Verification Report")
@@ -314,23 +398,23 @@ class Orchestrator:
             if user_decision.lower().startswith("/accept_changes"):
                 await self._commit_changes(plan, task)
                 task.status = "completed"
-                filesystem.save_plan(self.plan_dir / plan.plan_id / "plan.yml", plan)
+                await asyncio.to_thread(
+                    filesystem.record_task_status,
+                    self.plan_dir / plan.plan_id / "plan.yml",
+                    task,
+                )
                 return  # Exit the loop and task cycle successfully
 
             elif user_decision.lower().startswith("/reject_changes"):
                 feedback_text = user_decision.replace("/reject_changes", "").strip()
 
-                # Load existing report content and append new feedback
-                existing_content = ""
-                if report_file.exists():
-                    existing_content = filesystem.read_file(report_file) or ""
-
-                combined_feedback = existing_content
+                # Append the new feedback to the report just written
+                combined_feedback = verification_report
                 if feedback_text:
                     combined_feedback += f"\n\n--- User Feedback (Attempt {current_try}) ---\n{feedback_text}"
 
-                # Update the report file with the new feedback
-                filesystem.write_file(report_file, combined_feedback)
+                    # Update the report file with the new feedback
+                    await filesystem.write_file_async(report_file, combined_feedback)
 
                 verification_feedback = combined_feedback
                 display.warning("Changes rejected. Rerunning Coder with feedback...")
@@ -343,66 +427,151 @@ class Orchestrator:
             f"Task '{task.id}' failed after {max_retries} attempts. Manual intervention needed."
         )
         task.status = "failed"
-        filesystem.save_plan(self.plan_dir / plan.plan_id / "plan.yml", plan)
+        await asyncio.to_thread(
+            filesystem.record_task_status,
+            self.plan_dir / plan.plan_id / "plan.yml",
+            task,
+        )
 
     async def _run_verification(self, task: Task) -> str:
         """Runs all configured verification steps, including commands and agents."""
-        diff = git.get_git_diff(self.project_root)
+        # The commands only need the files on disk, so they run while the agent
+        # verifiers review the diff
+        command_task = asyncio.create_task(self._run_command_verifiers())
+        diff = await asyncio.to_thread(git.get_git_diff, self.project_root)
+        try:
+            agent_reports = await self._run_agent_verifiers(task, diff)
+        except BaseException:
+            command_task.cancel()
+            raise
+        command_reports = await command_task
+
         reports: list[str] = []
+        if command_reports:
+            reports.append("\n".join(["## Automated Checks\n", *command_reports]))
+        reports.extend(agent_reports)
+
+        return "\n\n---\n\n".join(reports)
 
-        # Run automated commands
-        command_reports: list[str] = []
+    async def _run_command_verifiers(self) -> list[str]:
+        """Runs the configured verification commands concurrently."""
         display.info("Running automated verification commands...")
-        for cmd_config in self.config.verification.commands:
-            try:
-                result = subprocess.run(
-                    cmd_config.command.split(),
-                    cwd=self.project_root,
-                    capture_output=True,
-                    text=True,
-                    check=False,  # Use False to capture output even on failure
-                )
-                status = "PASS" if result.returncode == 0 else "FAIL"
-                report_line = f"- **{cmd_config.name}:** {status}"
-                if status == "FAIL":
-                    report_line += f"\n  ```\n{result.stdout}\n{result.stderr}\n  ```"
-                command_reports.append(report_line)
-            except Exception as e:
-                command_reports.append(
-                    f"- **{cmd_config.name}:** ERROR\n  ```\n{e}\n  ```"
-                )
+        return await asyncio.gather(
+            *(
+                self._run_verification_command(cmd_config)
+                for cmd_config in self.config.verification.commands
+            )
+        )
 
-        if command_reports:
-            reports.append("## Automated Checks\n\n" + "\n".join(command_reports))
-
-        # Agent verifiers
-        verifiers = self.config.verifier_instances.model_dump()
-        for verifier_type, count in verifiers.items():
-            if count > 0:
-                verifier = CodeVerifier(
-                    verifier_type,
-                    self.llm_provider,
-                    self.template_manager,
-                    self.config,
-                    self.project_root,
+    async def _run_agent_verifiers(self, task: Task, diff: str) -> list[str]:
+        """Runs the active agent verifiers concurrently on the same diff."""
+        timeout = self.config.verification.timeout_seconds
+        prompt = CodeVerifier.build_prompt(task, diff)
+        # rich shows one Live display at a time, so concurrent verifiers run
+        # without their own panels; the combined report is shown afterwards
+        live = len(self._active_verifiers) == 1
+        if not live:
+            display.info(
+                f"Running {len(self._active_verifiers)} verifiers concurrently..."
+            )
+        results = await _concurrency.run_batch(
+            (
+                asyncio.wait_for(
+                    self._get_verifier(verifier_type).run(
+                        task=task, prompt=prompt, live=live
+                    ),
+                    timeout,
                 )
-                report = await verifier.run(task=task, diff=diff)
-                reports.append(f"## Verifier: {verifier_type.title()}\n\n{report}")
+                for verifier_type in self._active_verifiers
+            ),
+            limit=self.config.verification.max_concurrency,
+        )
 
-        return "\n\n---\n\n".join(reports)
+        reports: list[str] = []
+        for verifier_type, outcome in zip(self._active_verifiers, results, strict=True):
+            if isinstance(outcome, asyncio.TimeoutError):
+                report = f"TIMEOUT after {timeout:g}s"
+            elif isinstance(outcome, BaseException):
+                report = f"ERROR\n  ```\n{outcome}\n  ```"
+            else:
+                report = outcome
+            reports.append(f"## Verifier: {verifier_type.title()}\n\n{report}")
+        return reports
+
+    @staticmethod
+    async def _read_tail(stream: asyncio.StreamReader | None) -> str:
+        """Drains a pipe, keeping only its last _OUTPUT_TAIL_LINES lines."""
+        if stream is None:
+            return ""
+
+        tail: deque[bytes] = deque(maxlen=_OUTPUT_TAIL_LINES)
+        read = 0
+        while True:
+            try:
+                line = await stream.readline()
+            except ValueError:
+                # The rest of an over-long line arrives on the next read
+                line = b"[line truncated]\n"
+            if not line:
+                break
+            tail.append(line)
+            read += 1
+
+        text = b"".join(tail).decode(errors="replace")
+        if read > len(tail):
+            text = f"[{read - len(tail)} earlier lines omitted]\n{text}"
+        return text
+
+    async def _run_verification_command(self, cmd_config: VerificationCommand) -> str:
+        """Runs one verification command and formats its report line."""
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *shlex.split(cmd_config.command),
+                cwd=self.project_root,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=_OUTPUT_LINE_LIMIT,
+            )
+        except Exception as e:
+            return f"- **{cmd_config.name}:** ERROR\n  ```\n{e}\n  ```"
+
+        timeout = self.config.verification.timeout_seconds
+        try:
+            stdout, stderr, _ = await asyncio.wait_for(
+                asyncio.gather(
+                    self._read_tail(proc.stdout),
+                    self._read_tail(proc.stderr),
+                    proc.wait(),
+                ),
+                timeout,
+            )
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return f"- **{cmd_config.name}:** TIMEOUT after {timeout:g}s"
+        except asyncio.CancelledError:
+            # Do not leave the command running when verification is abandoned
+            proc.kill()
+            raise
+
+        if proc.returncode == 0:
+            return f"- **{cmd_config.name}:** PASS"
+        # Built in one pass, as the output of a failing command can be long
+        return f"- **{cmd_config.name}:** FAIL\n  ```\n{stdout}\n{stderr}\n  ```"
 
     async def _commit_changes(self, plan: Plan, task: Task) -> None:
         self.state = OrchestratorState.COMMITTING
-        committer = self._create_agent(Committer)
+        committer = self._get_agent(Committer)
         commit_message = await committer.run(task=task)
 
-        if git.commit_changes(self.project_root, commit_message):
+        if await asyncio.to_thread(
+            git.commit_changes, self.project_root, commit_message
+        ):
             display.success(f"Task '{task.id}' committed successfully.")
 
             # Delete the verification report file after successful commit
             report_file = self.report_dir / plan.plan_id / f"{task.id}.md"
-            if report_file.exists():
-                report_file.unlink()
+            await asyncio.to_thread(report_file.unlink, missing_ok=True)
         else:
             display.error(f"Failed to commit changes for task '{task.id}'.")
             display.warning(
@@ -411,61 +580,59 @@ class Orchestrator:
             self.state = OrchestratorState.HALTED_FOR_ERROR
             raise Exception("Git commit failed. Manual intervention required.")
 
-    def _select_next_task(self, plan: Plan) -> str:
-        """Deterministically finds the next pending task whose dependencies are met."""
-        display.info("Determining next task...")
+    def _select_next_task(self, scheduler: TaskScheduler) -> Task | None:
+        """
+        Deterministically finds the next pending task whose dependencies are met.
 
-        completed_task_ids = {
-            task.id for task in plan.tasks if task.status == "completed"
-        }
+        Returns:
+            The next task to execute, or None when no task is ready.
+        """
+        display.info("Determining next task...")
 
-        for task in plan.tasks:
-            if task.status == "pending" and all(
-                dep_id in completed_task_ids for dep_id in task.dependencies
-            ):
-                display.info(f"Next task is '{task.id}'.")
-                return task.id
+        task = scheduler.next_task()
+        if task is not None:
+            display.info(f"Next task is '{task.id}'.")
+            return task
 
         display.info("All tasks are complete.")
-        return "PLAN_COMPLETE"
-
-    def _get_latest_plan(self) -> Plan | None:
-        """Finds the most recent plan file."""
-        plan_dirs = sorted(self.plan_dir.iterdir(), key=os.path.getmtime, reverse=True)
-        if not plan_dirs:
-            return None
-
-        latest_plan_path = plan_dirs[0] / "plan.yml"
-        return filesystem.load_plan(latest_plan_path)
+        return None
+
+    def _plan_dirs_by_mtime(self) -> list[tuple[int, Path]]:
+        """Lists plan directories with their mtimes from a single directory scan."""
+        with os.scandir(self.plan_dir) as entries:
+            return [
+                (entry.stat().st_mtime_ns, Path(entry.path))
+                for entry in entries
+                if entry.is_dir()
+            ]
 
-    def _select_plan_interactively(self) -> Plan | None:
+    async def _select_plan_interactively(self) -> Plan | None:
         """Allows the user to choose from existing plans in .codeteam/planning."""
-        plan_dirs = [d for d in self.plan_dir.iterdir() if d.is_dir()]
+        plan_dirs = self._plan_dirs_by_mtime()
         if not plan_dirs:
             display.error(
                 f"No plans found in {self.plan_dir.relative_to(self.project_root)}."
             )
             return None
 
-        # Sort by creation time (newest first)
-        plan_dirs = sorted(plan_dirs, key=os.path.getmtime, reverse=True)
+        # Sort by modification time (newest first)
+        plan_dirs.sort(reverse=True)
 
         # Create menu options
         plan_options = []
         plan_map = {}
 
-        for plan_dir in plan_dirs:
-            plan_file = plan_dir / "plan.yml"
-            if plan_file.exists():
-                try:
-                    plan = filesystem.load_plan(plan_file)
-                    if plan:
-                        option_name = f"{plan_dir.name}: {plan.description}"
-                        plan_options.append(option_name)
-                        plan_map[option_name] = plan
-                except Exception:
-                    # Skip invalid plans
-                    continue
+        for _, plan_dir in plan_dirs:
+            try:
+                # A missing plan.yml loads as None
+                plan = yaml_cache.load_plan(plan_dir / "plan.yml")
+                if plan:
+                    option_name = f"{plan_dir.name}: {plan.description}"
+                    plan_options.append(option_name)
+                    plan_map[option_name] = plan
+            except Exception:
+                # Skip invalid plans
+                continue
 
         if not plan_options:
             display.error(
@@ -474,15 +641,14 @@ class Orchestrator:
             return None
 
         # Show interactive menu
-        selected_option = interactive.get_menu_choice(
-            "Select a plan to execute:", plan_options
+        selected_option = await ask_async(
+            interactive.get_menu_choice, "Select a plan to execute:", plan_options
         )
 
         return plan_map.get(selected_option)
 
     async def _get_user_decision(self) -> str:
         """Get user decision for verification review using interactive menus."""
-        loop = asyncio.get_event_loop()
 
         def get_decision() -> str:
             choice = interactive.get_menu_choice(
@@ -499,10 +665,15 @@ class Orchestrator:
                     return "/reject_changes"
             return choice
 
-        return await loop.run_in_executor(None, get_decision)
+        return await ask_async(get_decision)
 
     def display_dashboard(self) -> None:
         """Display a dashboard with project status overview."""
+        with display.batch():
+            self._render_dashboard()
+
+    def _render_dashboard(self) -> None:
+        """Print the plans table, latest plan details and task progress."""
         # Get all plans
         plan_dirs = [d for d in self.plan_dir.iterdir() if d.is_dir()]
         if not plan_dirs:
@@ -525,7 +696,7 @@ class Orchestrator:
             plan_file = plan_dir / "plan.yml"
             if plan_file.exists():
                 try:
-                    plan = filesystem.load_plan(plan_file)
+                    plan = yaml_cache.load_plan(plan_file)
                     if plan:
                         if latest_plan is None:
                             latest_plan = plan
@@ -638,13 +809,7 @@ class Orchestrator:
 
         if pending_count > 0:
             # Check if there are tasks ready to execute
-            completed_ids = {t.id for t in plan.tasks if t.status == "completed"}
-            ready_tasks = [
-                t
-                for t in plan.tasks
-                if t.status == "pending"
-                and all(dep in completed_ids for dep in t.dependencies)
-            ]
+            ready_tasks = TaskScheduler(plan).ready_tasks()
 
             if ready_tasks:
                 suggestions.append(
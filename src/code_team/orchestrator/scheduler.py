@@ -0,0 +1,64 @@
+"""Dependency-aware task scheduling for the coding phase."""
+
+import heapq
+from collections import defaultdict
+
+from code_team.models.plan import Plan, Task
+
+
+class TaskScheduler:
+    """
+    Tracks which pending tasks of a plan have all their dependencies completed.
+
+    Each task keeps a count of its unmet dependencies and an index maps every
+    task to its dependents, so completing a task only touches the tasks that
+    depend on it (Kahn's algorithm). Ready tasks are kept in a heap ordered by
+    their position in the plan, which keeps selection deterministic.
+    """
+
+    def __init__(self, plan: Plan):
+        self._position = {task.id: index for index, task in enumerate(plan.tasks)}
+        self._completed_ids = {
+            task.id for task in plan.tasks if task.status == "completed"
+        }
+        self._remaining: dict[str, int] = {}
+        self._dependents: defaultdict[str, list[Task]] = defaultdict(list)
+        self._ready: list[tuple[int, Task]] = []
+
+        for task in plan.tasks:
+            unmet = set(task.dependencies) - self._completed_ids
+            self._remaining[task.id] = len(unmet)
+            for dep_id in unmet:
+                self._dependents[dep_id].append(task)
+            if not unmet and task.status == "pending":
+                heapq.heappush(self._ready, (self._position[task.id], task))
+
+    @property
+    def completed_ids(self) -> set[str]:
+        """The IDs of the completed tasks."""
+        return self._completed_ids
+
+    def _discard_started(self) -> None:
+        """Drops ready entries for tasks that are no longer pending."""
+        while self._ready and self._ready[0][1].status != "pending":
+            heapq.heappop(self._ready)
+
+    def next_task(self) -> Task | None:
+        """Returns the first ready task in plan order, or None if none is ready."""
+        self._discard_started()
+        return self._ready[0][1] if self._ready else None
+
+    def ready_tasks(self) -> list[Task]:
+        """Returns every ready task in plan order."""
+        self._discard_started()
+        return [task for _, task in sorted(self._ready) if task.status == "pending"]
+
+    def mark_completed(self, task: Task) -> None:
+        """Records a completed task and releases the tasks waiting only on it."""
+        if task.id in self._completed_ids:
+            return
+        self._completed_ids.add(task.id)
+        for dependent in self._dependents.pop(task.id, []):
+            self._remaining[dependent.id] -= 1
+            if self._remaining[dependent.id] == 0 and dependent.status == "pending":
+                heapq.heappush(self._ready, (self._position[dependent.id], dependent))
@@ -1,8 +1,23 @@
+import asyncio
+import contextlib
+import json
+import os
 from pathlib import Path
+from typing import Any
 
 import yaml
 
-from code_team.models.plan import Plan
+from code_team.models.plan import Plan, Task
+
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+# Journal length beyond which load_plan compacts it into plan.yml
+_JOURNAL_COMPACT_LINES = 1000
 
 
 def write_file(path: Path, content: str) -> None:
@@ -16,49 +31,183 @@ def read_file(path: Path) -> str | None:
     return path.read_text(encoding="utf-8") if path.exists() else None
 
 
+def ensure_ignored_dir(path: Path) -> None:
+    """Create a directory of generated files that git should never track.
+
+    A .gitignore matching everything keeps the directory out of the `git add .`
+    used when committing task changes.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    gitignore = path / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text("*\n", encoding="utf-8")
+
+
+async def write_file_async(path: Path, content: str) -> None:
+    """Write a file in a worker thread so the event loop keeps running."""
+    await asyncio.to_thread(write_file, path, content)
+
+
+async def read_file_async(path: Path) -> str | None:
+    """Read a file in a worker thread so the event loop keeps running."""
+    return await asyncio.to_thread(read_file, path)
+
+
+_DEFAULT_EXCLUDE_DIRS = [
+    ".git",
+    ".mypy_cache",
+    ".ruff_cache",
+    ".venv",
+    ".idea",
+    "__pycache__",
+    ".codeteam",
+    "node_modules",
+    "build",
+]
+
+
+def _scan_repo(root: Path, exclude_dirs: list[str]) -> tuple[str, dict[str, int]]:
+    """Render the file tree under root and record the mtime of each directory.
+
+    Excluded entries are skipped without descending into them, and entries are
+    listed depth first in name order.
+    """
+    excluded = set(exclude_dirs)
+    lines: list[str] = []
+    dir_mtimes: dict[str, int] = {}
+
+    def visit(directory: str, depth: int) -> None:
+        try:
+            # Stat before listing so a change made during the scan is seen later
+            dir_mtimes[directory] = os.stat(directory).st_mtime_ns
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            return
+        for entry in entries:
+            if entry.name in excluded:
+                continue
+            is_dir = entry.is_dir()
+            lines.append(f"{'    ' * depth}|-- {entry.name}{'/' if is_dir else ''}")
+            # Like rglob, symlinked directories are listed but not followed
+            if is_dir and not entry.is_symlink():
+                visit(entry.path, depth + 1)
+
+    visit(str(root), 0)
+    return "\n".join(lines), dir_mtimes
+
+
 def get_repo_map(root: Path, exclude_dirs: list[str] | None = None) -> str:
     """Generate a string representation of the repository file tree."""
     if exclude_dirs is None:
-        exclude_dirs = [
-            ".git",
-            ".mypy_cache",
-            ".ruff_cache",
-            ".venv",
-            ".idea",
-            "__pycache__",
-            ".codeteam",
-            "node_modules",
-            "build",
-        ]
+        exclude_dirs = _DEFAULT_EXCLUDE_DIRS
+    return _scan_repo(root, exclude_dirs)[0]
 
-    lines: list[str] = []
-    for path in sorted(root.rglob("*")):
-        if any(d in path.parts for d in exclude_dirs):
-            continue
 
-        depth = len(path.relative_to(root).parts) - 1
-        indent = "    " * depth
-        lines.append(
-            f"{indent}{'|-- ' if depth > -1 else ''}{path.name}{'/' if path.is_dir() else ''}"
+class RepoMap:
+    """The repository file tree, rescanned only when one of its directories changes.
+
+    Adding, removing or renaming an entry updates the mtime of the directory
+    holding it, so checking the directories seen by the last scan costs one
+    stat per directory instead of a full listing of the tree.
+    """
+
+    def __init__(self, root: Path, exclude_dirs: list[str] | None = None):
+        self._root = root
+        self._exclude_dirs = (
+            _DEFAULT_EXCLUDE_DIRS if exclude_dirs is None else exclude_dirs
         )
+        self._text: str | None = None
+        self._dir_mtimes: dict[str, int] = {}
+
+    def get(self) -> str:
+        """Return the current file tree, reusing the last scan while it is valid."""
+        if self._text is None or self._is_stale():
+            self._text, self._dir_mtimes = _scan_repo(self._root, self._exclude_dirs)
+        return self._text
+
+    def _is_stale(self) -> bool:
+        for directory, mtime in self._dir_mtimes.items():
+            try:
+                if os.stat(directory).st_mtime_ns != mtime:
+                    return True
+            except OSError:
+                return True
+        return False
 
-    return "\n".join(lines)
+
+def parse_yaml(content: str) -> Any:
+    """Parse YAML safely, using the libyaml C parser when it is available."""
+    return yaml.load(content, Loader=_SafeLoader)
+
+
+def status_journal_path(plan_path: Path) -> Path:
+    """Return the task status journal kept next to a plan file."""
+    return plan_path.with_name("status.jsonl")
+
+
+def _read_status_journal(plan_path: Path) -> tuple[dict[str, str], int]:
+    """Return the latest journaled status of each task and the journal's length."""
+    statuses: dict[str, str] = {}
+    content = read_file(status_journal_path(plan_path))
+    lines = (content or "").splitlines()
+    for line in lines:
+        try:
+            entry = json.loads(line)
+            statuses[entry["task_id"]] = entry["status"]
+        except (ValueError, TypeError, KeyError):
+            # A torn final line from an interrupted append
+            continue
+    return statuses, len(lines)
 
 
 def load_plan(plan_path: Path) -> Plan | None:
-    """Load and parse the plan.yml file."""
+    """Load and parse the plan.yml file, applying any journaled task statuses.
+
+    A journal longer than _JOURNAL_COMPACT_LINES is folded back into plan.yml,
+    so it cannot grow without bound between saves.
+    """
     content = read_file(plan_path)
     if not content:
         return None
     try:
-        plan_data = yaml.safe_load(content)
-        return Plan.model_validate(plan_data)
+        plan_data = parse_yaml(content)
+        statuses, journal_lines = _read_status_journal(plan_path)
+        if statuses and isinstance(plan_data, dict):
+            for task_data in plan_data.get("tasks") or []:
+                if isinstance(task_data, dict) and task_data.get("id") in statuses:
+                    task_data["status"] = statuses[task_data["id"]]
+        plan = Plan.model_validate(plan_data)
     except (yaml.YAMLError, ValueError) as e:
         print(f"Error parsing plan file {plan_path}: {e}")
         return None
 
+    if journal_lines > _JOURNAL_COMPACT_LINES:
+        with contextlib.suppress(OSError):
+            save_plan(plan_path, plan)
+    return plan
+
 
 def save_plan(plan_path: Path, plan: Plan) -> None:
-    """Save a Plan object to a YAML file."""
+    """Save a Plan object to a YAML file, folding in the status journal.
+
+    The plan is written to a temporary file and renamed over plan.yml, so an
+    interrupted save never leaves a truncated plan behind.
+    """
     plan_dict = plan.model_dump(mode="json")
-    write_file(plan_path, yaml.dump(plan_dict, sort_keys=False))
+    tmp_path = plan_path.with_name(f"{plan_path.name}.tmp")
+    write_file(tmp_path, yaml.dump(plan_dict, Dumper=_SafeDumper, sort_keys=False))
+    os.replace(tmp_path, plan_path)
+    status_journal_path(plan_path).unlink(missing_ok=True)
+
+
+def record_task_status(plan_path: Path, task: Task) -> None:
+    """Append a task's status to the plan's journal instead of rewriting the plan.
+
+    load_plan replays the journal over plan.yml, and save_plan folds it back
+    into plan.yml.
+    """
+    journal = status_journal_path(plan_path)
+    journal.parent.mkdir(parents=True, exist_ok=True)
+    with journal.open("a", encoding="utf-8") as f:
+        f.write(json.dumps({"task_id": task.id, "status": task.status}) + "\n")
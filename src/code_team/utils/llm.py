@@ -1,16 +1,33 @@
+import asyncio
 from collections.abc import AsyncIterator
 
-from claude_code_sdk import ClaudeCodeOptions, Message, query
+from claude_code_sdk import (
+    AssistantMessage,
+    ClaudeCodeOptions,
+    Message,
+    ResultMessage,
+    TextBlock,
+    query,
+)
 
 from code_team.models.config import LLMConfig
+from code_team.utils.llm_cache import LLMCache, cache_key
 
 
 class LLMProvider:
     """A wrapper around the Claude Code SDK for standardized LLM calls."""
 
-    def __init__(self, config: LLMConfig, cwd: str):
+    def __init__(
+        self,
+        config: LLMConfig,
+        cwd: str,
+        cache: LLMCache | None = None,
+    ):
         self._config = config
         self._cwd = cwd
+        self.cache = cache
+        # Futures for cached requests currently being answered by the SDK
+        self._in_flight: dict[str, asyncio.Future[str | None]] = {}
 
     async def query(
         self,
@@ -44,3 +61,127 @@ class LLMProvider:
         # It's an async generator, so we yield from it.
         async for message in query(prompt=prompt, options=options):
             yield message
+
+    async def cached_query(
+        self,
+        prompt: str,
+        system_prompt: str,
+        allowed_tools: list[str] | None = None,
+        model: str | None = None,
+    ) -> AsyncIterator[Message]:
+        """
+        Perform a query, serving identical requests from the response cache.
+
+        On a hit the cached text is replayed as a single assistant message
+        followed by a successful result, skipping the SDK round-trip. On a miss
+        the live stream is passed through and its text is stored once the
+        stream completes without error. Identical requests issued while a miss
+        is still streaming wait for it and replay its response instead of
+        starting a second SDK call.
+
+        Args:
+            prompt: The user-level prompt for the current turn.
+            system_prompt: The detailed system prompt guiding the agent.
+            allowed_tools: A list of tools the agent can use.
+            model: The model to use for this query.
+
+        Yields:
+            Messages from the cache or the SDK's response stream.
+        """
+        if self.cache is None:
+            async for message in self.query(
+                prompt, system_prompt, allowed_tools, model
+            ):
+                yield message
+            return
+
+        key = cache_key(
+            model or self._config.planner,
+            [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt},
+            ],
+            allowed_tools,
+        )
+
+        cached = self.cache.get(key)
+        if cached is None and (pending := self._in_flight.get(key)) is not None:
+            # An identical request is already running; share its answer
+            cached = await asyncio.shield(pending)
+        if cached is not None:
+            for message in self._replay(cached):
+                yield message
+            return
+
+        future: asyncio.Future[str | None] = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        response: str | None = None
+        try:
+            text_parts: list[str] = []
+            failed = False
+            async for message in self.query(
+                prompt, system_prompt, allowed_tools, model
+            ):
+                if isinstance(message, AssistantMessage):
+                    text_parts.extend(self._text_of(message))
+                elif isinstance(message, ResultMessage) and message.is_error:
+                    failed = True
+                yield message
+
+            if text_parts and not failed:
+                response = "".join(text_parts)
+                self.cache.set(key, response)
+        finally:
+            # Waiters fall back to their own query when no response was stored
+            future.set_result(response)
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    async def query_text(
+        self,
+        prompt: str,
+        system_prompt: str,
+        allowed_tools: list[str] | None = None,
+        model: str | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Perform a query and yield only the response text.
+
+        For callers that need the text but not the tool calls or result
+        metadata of the message stream. The response cache is bypassed, so
+        the answer always reflects the current request.
+
+        Args:
+            prompt: The user-level prompt for the current turn.
+            system_prompt: The detailed system prompt guiding the agent.
+            allowed_tools: A list of tools the agent can use.
+            model: The model to use for this query.
+
+        Yields:
+            The text of each assistant text block, in order.
+        """
+        async for message in self.query(prompt, system_prompt, allowed_tools, model):
+            if isinstance(message, AssistantMessage):
+                for text in self._text_of(message):
+                    yield text
+
+    @staticmethod
+    def _text_of(message: AssistantMessage) -> list[str]:
+        """Return the text of an assistant message's text blocks."""
+        return [block.text for block in message.content if isinstance(block, TextBlock)]
+
+    @staticmethod
+    def _replay(text: str) -> list[Message]:
+        """Build the messages that stand in for a cached response."""
+        return [
+            AssistantMessage(content=[TextBlock(text=text)]),
+            ResultMessage(
+                subtype="success",
+                duration_ms=0,
+                duration_api_ms=0,
+                is_error=False,
+                num_turns=0,
+                session_id="cache",
+                result=text,
+            ),
+        ]
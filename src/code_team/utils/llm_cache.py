@@ -0,0 +1,232 @@
+"""Exact-match response cache for deterministic LLM calls."""
+
+import hashlib
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Protocol
+
+try:
+    import orjson  # type: ignore[import-not-found,unused-ignore]
+except ImportError:
+    orjson = None  # type: ignore[assignment,unused-ignore]
+
+
+def _canonical_json(payload: Any) -> bytes:
+    """Serialize a payload to compact, key-sorted UTF-8 JSON.
+
+    Uses orjson when it is installed. The fallback emits byte-identical output,
+    so cache keys do not depend on which serializer is available.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode()
+
+
+def cache_key(
+    model: str, messages: list[dict[str, str]], tools: list[str] | None = None
+) -> str:
+    """Build a stable cache key for an LLM request.
+
+    Args:
+        model: The model the request is sent to.
+        messages: The request messages as role/content dictionaries.
+        tools: The tools the agent is allowed to use, if any.
+
+    Returns:
+        A hex SHA-256 digest identifying the request.
+    """
+    payload = {"model": model, "messages": messages, "tools": sorted(tools or [])}
+    return hashlib.sha256(_canonical_json(payload)).hexdigest()
+
+
+class CacheBackend(Protocol):
+    """Storage interface used by the LLM cache."""
+
+    def get(self, key: str) -> str | None:
+        """Return the cached value for a key, or None if missing or expired."""
+        ...
+
+    def set(self, key: str, value: str, ttl: float | None = None) -> None:
+        """Store a value, optionally expiring after ttl seconds."""
+        ...
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+        ...
+
+
+class MemoryCacheBackend:
+    """In-process LRU cache backend."""
+
+    def __init__(self, maxsize: int = 256):
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[str, float | None]] = OrderedDict()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached value for a key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at is not None and expires_at < time.time():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str, ttl: float | None = None) -> None:
+        """Store a value, evicting the least recently used entries when full."""
+        expires_at = time.time() + ttl if ttl is not None else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def close(self) -> None:
+        """Nothing to release; entries live in process memory."""
+
+
+class JSONFileCacheBackend:
+    """On-disk cache backend storing one JSON file per key."""
+
+    def __init__(self, directory: Path):
+        self._directory = directory
+
+    def _path(self, key: str) -> Path:
+        return self._directory / f"{key}.json"
+
+    def get(self, key: str) -> str | None:
+        """Return the cached value for a key, or None if missing or expired."""
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and expires_at < time.time():
+            path.unlink(missing_ok=True)
+            return None
+
+        value = entry.get("value")
+        return value if isinstance(value, str) else None
+
+    def set(self, key: str, value: str, ttl: float | None = None) -> None:
+        """Write a value to disk, optionally expiring after ttl seconds."""
+        expires_at = time.time() + ttl if ttl is not None else None
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._path(key).write_text(
+            json.dumps({"value": value, "expires_at": expires_at}), encoding="utf-8"
+        )
+
+    def close(self) -> None:
+        """Nothing to release; each entry is written and closed on its own."""
+
+
+class SQLiteCacheBackend:
+    """On-disk cache backend storing all entries in a single SQLite database."""
+
+    def __init__(self, path: Path):
+        self._path = path
+        self._connection: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self._path)
+            with self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+                )
+        return self._connection
+
+    def get(self, key: str) -> str | None:
+        """Return the cached value for a key, or None if missing or expired."""
+        connection = self._connect()
+        row = connection.execute(
+            "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        value, expires_at = row
+        if expires_at is not None and expires_at < time.time():
+            with connection:
+                connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            return None
+        return str(value)
+
+    def set(self, key: str, value: str, ttl: float | None = None) -> None:
+        """Store a value, optionally expiring after ttl seconds."""
+        expires_at = time.time() + ttl if ttl is not None else None
+        connection = self._connect()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, value, expires_at),
+            )
+
+    def close(self) -> None:
+        """Close the database connection if it is open."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+class TieredCacheBackend:
+    """Chains backends from fastest to slowest, promoting hits to faster tiers."""
+
+    def __init__(self, *backends: CacheBackend):
+        self._backends = backends
+
+    def get(self, key: str) -> str | None:
+        """Return the first hit, copying it into the faster tiers."""
+        for index, backend in enumerate(self._backends):
+            value = backend.get(key)
+            if value is not None:
+                for faster in self._backends[:index]:
+                    faster.set(key, value)
+                return value
+        return None
+
+    def set(self, key: str, value: str, ttl: float | None = None) -> None:
+        """Store a value in every tier."""
+        for backend in self._backends:
+            backend.set(key, value, ttl)
+
+    def close(self) -> None:
+        """Close every tier."""
+        for backend in self._backends:
+            backend.close()
+
+
+class LLMCache:
+    """Response cache keyed on the full LLM request."""
+
+    def __init__(self, backend: CacheBackend, ttl: float | None = 86400):
+        self.backend = backend
+        self.ttl = ttl
+        self.stats = {"hits": 0, "misses": 0}
+
+    def get(self, key: str) -> str | None:
+        """Look up a cached response and record the hit or miss."""
+        value = self.backend.get(key)
+        self.stats["hits" if value is not None else "misses"] += 1
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store a response using the cache's TTL."""
+        self.backend.set(key, value, ttl=self.ttl)
+
+    def close(self) -> None:
+        """Release the backend's resources, such as a database connection."""
+        self.backend.close()
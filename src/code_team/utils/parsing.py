@@ -1,6 +1,41 @@
 """Utilities for parsing and extracting content from text responses."""
 
-import re
+_FENCE = "```"
+_CLOSING_FENCE = "\n```"
+
+
+def _closing_fence(text: str, content_start: int) -> int:
+    """
+    Find the closing fence of a block whose content starts at content_start.
+
+    A closing fence is a newline followed by exactly three backticks.
+
+    Returns:
+        The index of the newline before the closing fence, or -1 if the block
+        is not closed.
+    """
+    close = text.find(_CLOSING_FENCE, content_start)
+    while close != -1 and text.startswith("`", close + len(_CLOSING_FENCE)):
+        close = text.find(_CLOSING_FENCE, close + 1)
+    return close
+
+
+def _first_generic_block(text: str) -> str | None:
+    """Return the content of the first block without a language tag."""
+    fence = text.find(_FENCE)
+    while fence != -1:
+        newline = text.find("\n", fence + len(_FENCE))
+        if newline == -1:
+            return None
+        close = _closing_fence(text, newline + 1)
+        if close == -1:
+            # No later block can be closed either
+            return None
+        if not text[fence + len(_FENCE) : newline].strip():
+            return text[newline + 1 : close].strip()
+        # Skip over the language-specific block
+        fence = text.find(_FENCE, close + len(_CLOSING_FENCE))
+    return None
 
 
 def extract_code_block(text: str, language: str = "") -> str | None:
@@ -22,27 +57,13 @@ def extract_code_block(text: str, language: str = "") -> str | None:
     """
     if language:
         # Look for exact language-specific block first
-        # Escape special regex characters in language and ensure exact match
-        escaped_language = re.escape(language)
-        pattern = rf"```{escaped_language}\n(.*?)\n```(?!`)"
-        match = re.search(pattern, text, re.DOTALL)
-        if match:
-            return match.group(1).strip()
-
-        # Fallback to generic code blocks only (not other language-specific ones)
-        # Ensure proper closing with exactly 3 backticks
-        pattern = r"```([^\n]*)\n(.*?)\n```(?!`)"
-        for match in re.finditer(pattern, text, re.DOTALL):
-            language_part = match.group(1).strip()
-            if not language_part:  # Empty language = generic block
-                return match.group(2).strip()
-        return None
-    else:
-        # No language specified, get first generic code block only
-        # Find all code blocks and return first one without language
-        pattern = r"```([^\n]*)\n(.*?)\n```(?!`)"
-        for match in re.finditer(pattern, text, re.DOTALL):
-            language_part = match.group(1).strip()
-            if not language_part:  # Empty language = generic block
-                return match.group(2).strip()
-        return None
+        opening = f"{_FENCE}{language}\n"
+        fence = text.find(opening)
+        if fence != -1:
+            content_start = fence + len(opening)
+            close = _closing_fence(text, content_start)
+            if close != -1:
+                return text[content_start:close].strip()
+
+    # Fall back to generic code blocks only (not other language-specific ones)
+    return _first_generic_block(text)
@@ -1,12 +1,22 @@
 import contextlib
+import functools
 import importlib.resources
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-from jinja2 import BaseLoader, Environment, FileSystemLoader, TemplateNotFound
+from jinja2 import (
+    BaseLoader,
+    DictLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    TemplateNotFound,
+    meta,
+)
 
-from code_team.utils.filesystem import get_repo_map
+from code_team.utils.filesystem import RepoMap
 
 
 class HybridTemplateLoader(BaseLoader):
@@ -108,40 +118,133 @@ class TemplateManager:
         project_root: Path | None = None,
         guideline_files: list[str] | None = None,
         exclude_dirs: list[str] | None = None,
+        bytecode_cache_dir: Path | None = None,
+        auto_reload: bool = True,
+        loader: BaseLoader | None = None,
     ):
-        self._loader = HybridTemplateLoader(template_dir, "code_team", "templates")
-        self._env = Environment(loader=self._loader)
+        self._loader: BaseLoader = loader or HybridTemplateLoader(
+            template_dir, "code_team", "templates"
+        )
+        bytecode_cache = None
+        if bytecode_cache_dir is not None:
+            # Compiled templates are reused across runs; stale entries are
+            # detected by Jinja from the template source checksum. The
+            # directory must already exist; the orchestrator creates it.
+            bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir))
+        # With auto_reload disabled, cached templates are served without checking
+        # whether their source changed on disk.
+        self._env = Environment(
+            loader=self._loader,
+            bytecode_cache=bytecode_cache,
+            auto_reload=auto_reload,
+            cache_size=400,
+        )
         self._project_root = project_root
+        self._repo_map = (
+            RepoMap(project_root, exclude_dirs) if project_root is not None else None
+        )
         self._guideline_files = guideline_files or [
             "ARCHITECTURE_GUIDELINES.md",
             "CODING_GUIDELINES.md",
             "AGENT_OBJECTIVITY.md",
         ]
-        self._exclude_dirs = exclude_dirs
+        # Guideline sources with the loader's up-to-date check, so an unchanged
+        # file costs a stat instead of a read on every render.
+        self._guideline_cache: dict[str, tuple[str, Callable[[], bool] | None]] = {}
+        # Keyed on the Template object, which Jinja replaces when the source
+        # changes on disk, so edited templates are never served stale.
+        self._render_cached = functools.lru_cache(maxsize=128)(self._render_uncached)
+        # Also keyed on the Template object; parsed once per template version
+        self._context_names = functools.lru_cache(maxsize=128)(self._find_context_names)
+
+    @classmethod
+    def from_mapping(
+        cls, templates: dict[str, str], **kwargs: Any
+    ) -> "TemplateManager":
+        """Create a manager that renders templates held in memory.
+
+        Guideline files are looked up in the same mapping.
+
+        Args:
+            templates: Template sources keyed by template name.
+            **kwargs: Other TemplateManager options, e.g. guideline_files.
+        """
+        return cls(Path(), loader=DictLoader(templates), **kwargs)
+
+    def precompile(self) -> None:
+        """Compile every agent instruction template ahead of the first render."""
+        for template_name in self._loader.list_templates():
+            if template_name.endswith("_INSTRUCTIONS.md"):
+                self._env.get_template(template_name)
 
     def render(self, template_name: str, **kwargs: Any) -> str:
-        """Render a template with the given context."""
+        """Render a template with the given context.
+
+        Results are memoized on the template and the full rendering context,
+        so repeated renders with identical inputs return the same string
+        without re-running Jinja. Guideline files and the repo map are only
+        loaded when the template refers to them; the repo map is only rescanned
+        after the project tree changes, so it does not defeat the memo.
+        """
         template = self._env.get_template(template_name)
-        # Load common context files
+        needed = self._context_names(template)
+
+        # Load common context files the template refers to
         common_context = {}
         for guideline_file in self._guideline_files:
             # Create context key by removing extension and converting to uppercase
             context_key = guideline_file.replace(".md", "").upper()
-            common_context[context_key] = self._load_guideline(guideline_file)
+            if needed is None or context_key in needed:
+                common_context[context_key] = self._load_guideline(guideline_file)
 
         # Generate repo map content dynamically if project_root is available
-        if self._project_root:
-            common_context["REPO_MAP"] = get_repo_map(
-                self._project_root, self._exclude_dirs
-            )
+        if self._repo_map is not None and (needed is None or "REPO_MAP" in needed):
+            common_context["REPO_MAP"] = self._repo_map.get()
 
-        return template.render({**common_context, **kwargs})
+        context_items = tuple(sorted({**common_context, **kwargs}.items()))
+        try:
+            return self._render_cached(template, context_items)
+        except TypeError:
+            # Unhashable context values cannot be memoized
+            return self._render_uncached(template, context_items)
+
+    def _find_context_names(self, template: Template) -> frozenset[str] | None:
+        """
+        Return the context variables a template reads, or None if unknown.
+
+        Templates that include, import or extend others may read variables
+        through them, so they are reported as unknown.
+        """
+        if template.name is None:
+            return None
+        try:
+            source = self._loader.get_source(self._env, template.name)[0]
+            ast = self._env.parse(source)
+        except Exception:
+            return None
+        if any(True for _ in meta.find_referenced_templates(ast)):
+            return None
+        return frozenset(meta.find_undeclared_variables(ast))
+
+    @staticmethod
+    def _render_uncached(
+        template: Template, context_items: tuple[tuple[str, Any], ...]
+    ) -> str:
+        return template.render(dict(context_items))
 
     def _load_guideline(self, filename: str) -> str:
         """Safely load a guideline file."""
+        cached = self._guideline_cache.get(filename)
+        if cached is not None:
+            source, uptodate = cached
+            if uptodate is not None and uptodate():
+                return source
+
         try:
             if self._loader:
-                return self._loader.get_source(self._env, filename)[0]
+                source, _, uptodate = self._loader.get_source(self._env, filename)
+                self._guideline_cache[filename] = (source, uptodate)
+                return source
             return f"Guideline file '{filename}' not found."
         except (TemplateNotFound, Exception):
             # Handle cases where a specific guideline might be missing
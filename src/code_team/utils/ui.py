@@ -1,5 +1,10 @@
 """UI utilities for consistent theming and display management."""
 
+import asyncio
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import ParamSpec, TypeVar
+
 from rich.console import Console
 from rich.live import Live
 from rich.panel import Panel
@@ -14,6 +19,9 @@ from rich.progress import (
 from rich.prompt import Prompt
 from rich.theme import Theme
 
+P = ParamSpec("P")
+T = TypeVar("T")
+
 # Define a consistent theme for the CLI
 APP_THEME = Theme(
     {
@@ -38,6 +46,14 @@ APP_THEME = Theme(
 # Shared console instance with our theme
 console = Console(theme=APP_THEME)
 
+# Doubles square brackets so agent output is not interpreted as rich markup
+_RICH_ESCAPE_TABLE = str.maketrans({"[": "[[", "]": "]]"})
+
+
+def escape_rich(text: str) -> str:
+    """Escape user-generated content for display inside rich markup."""
+    return text.translate(_RICH_ESCAPE_TABLE)
+
 
 class DisplayManager:
     """Centralized display manager for consistent CLI output."""
@@ -85,6 +101,16 @@ class DisplayManager:
         """Direct access to console print method."""
         self.console.print(*args)
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Buffer console output and write it to the terminal in one go on exit.
+
+        Do not open a Live display inside a batch: its output would be held
+        back until the batch ends.
+        """
+        with self.console:
+            yield
+
     def create_overall_progress(self) -> Progress:
         """Create a progress bar for overall plan progress.
 
@@ -263,3 +289,17 @@ display = DisplayManager()
 
 # Global interactive manager instance
 interactive = InteractiveManager()
+
+
+async def ask_async(ask: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """Run a blocking prompt in a worker thread so the event loop keeps running.
+
+    Args:
+        ask: The blocking prompt function, e.g. interactive.get_menu_choice.
+        *args: Positional arguments for the prompt function.
+        **kwargs: Keyword arguments for the prompt function.
+
+    Returns:
+        Whatever the prompt function returns.
+    """
+    return await asyncio.to_thread(ask, *args, **kwargs)
@@ -0,0 +1,97 @@
+"""Process-wide cache of parsed YAML files, invalidated when a file changes."""
+
+import copy
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from code_team.models.plan import Plan
+from code_team.utils import filesystem
+
+_MAX_ENTRIES = 100
+
+# A file's identity for caching: (mtime in ns, size), or None if it is missing
+_Stamp = tuple[int, int] | None
+
+_yaml_entries: OrderedDict[str, tuple[_Stamp, Any]] = OrderedDict()
+_plan_entries: OrderedDict[str, tuple[tuple[_Stamp, _Stamp], Plan | None]] = (
+    OrderedDict()
+)
+
+
+def _stamp(path: Path) -> _Stamp:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _remember(entries: OrderedDict[str, Any], key: str, value: Any) -> None:
+    entries[key] = value
+    entries.move_to_end(key)
+    while len(entries) > _MAX_ENTRIES:
+        entries.popitem(last=False)
+
+
+def load_yaml(path: Path) -> Any:
+    """
+    Parse a YAML file, reusing the parsed data while the file is unchanged.
+
+    Args:
+        path: The YAML file to load.
+
+    Returns:
+        A copy of the parsed data, safe for the caller to modify.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    key = str(path)
+    stamp = _stamp(path)
+    if stamp is None:
+        _yaml_entries.pop(key, None)
+        raise FileNotFoundError(f"YAML file not found: {path}")
+
+    entry = _yaml_entries.get(key)
+    if entry is not None and entry[0] == stamp:
+        _yaml_entries.move_to_end(key)
+        return copy.deepcopy(entry[1])
+
+    data = filesystem.parse_yaml(path.read_text(encoding="utf-8"))
+    _remember(_yaml_entries, key, (stamp, data))
+    return copy.deepcopy(data)
+
+
+def load_plan(plan_path: Path) -> Plan | None:
+    """
+    Load a plan like filesystem.load_plan, reusing it while its files are unchanged.
+
+    Both plan.yml and its task status journal are checked, so journaled status
+    changes are picked up.
+
+    Args:
+        plan_path: The plan.yml file to load.
+
+    Returns:
+        A copy of the plan, or None if it is missing or invalid.
+    """
+    key = str(plan_path)
+    stamps = (_stamp(plan_path), _stamp(filesystem.status_journal_path(plan_path)))
+
+    entry = _plan_entries.get(key)
+    if entry is not None and entry[0] == stamps:
+        _plan_entries.move_to_end(key)
+        plan = entry[1]
+    else:
+        plan = filesystem.load_plan(plan_path)
+        _remember(_plan_entries, key, (stamps, plan))
+
+    return plan.model_copy(deep=True) if plan is not None else None
+
+
+def clear() -> None:
+    """Forget every cached file."""
+    _yaml_entries.clear()
+    _plan_entries.clear()
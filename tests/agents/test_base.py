@@ -1,5 +1,6 @@
 """Unit tests for base agent class."""
 
+import io
 from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any
@@ -256,6 +257,87 @@ class TestAgent:
         # Should have tool use line and parameter line
         assert any("[[markup]]" in line for line in content_lines)
 
+    @pytest.mark.asyncio
+    @patch("code_team.agents.base.Live")
+    @patch("code_team.agents.base.display")
+    async def test_stream_and_collect_response_buffers_text(
+        self, mock_display: Mock, mock_live: Mock
+    ) -> None:
+        """Test that short text blocks are redrawn together rather than one by one."""
+        mock_live.return_value = MagicMock()
+
+        async def mock_stream() -> AsyncIterator[Message]:
+            for word in ["One", "two", "three"]:
+                yield AssistantMessage(content=[TextBlock(text=word)])
+
+        result = await self.agent._stream_and_collect_response(mock_stream())
+
+        assert result == "Onetwothree"
+        mock_display.create_scrollable_panel.assert_called_once()
+        content_lines = mock_display.create_scrollable_panel.call_args[0][1]
+        assert content_lines == ["One", "two", "three"]
+
+    @pytest.mark.asyncio
+    @patch("code_team.agents.base.Live")
+    @patch("code_team.agents.base.display")
+    async def test_stream_and_collect_response_flushes_large_text(
+        self, mock_display: Mock, mock_live: Mock
+    ) -> None:
+        """Test that buffered text is redrawn once it reaches the flush size."""
+        mock_live.return_value = MagicMock()
+        chunk = "x" * Agent._STREAM_FLUSH_CHARS
+
+        async def mock_stream() -> AsyncIterator[Message]:
+            yield AssistantMessage(content=[TextBlock(text=chunk)])
+            yield AssistantMessage(content=[TextBlock(text="tail")])
+
+        await self.agent._stream_and_collect_response(mock_stream())
+
+        assert mock_display.create_scrollable_panel.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("code_team.agents.base.Live")
+    @patch("code_team.agents.base.display")
+    async def test_stream_and_collect_response_without_live(
+        self, mock_display: Mock, mock_live: Mock
+    ) -> None:
+        """Test that the response is collected without a Live panel when disabled."""
+
+        async def mock_stream() -> AsyncIterator[Message]:
+            yield AssistantMessage(content=[TextBlock(text="Quiet report")])
+
+        result = await self.agent._stream_and_collect_response(
+            mock_stream(), live=False
+        )
+
+        assert result == "Quiet report"
+        mock_live.assert_not_called()
+        mock_display.create_scrollable_panel.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("code_team.agents.base.Live")
+    @patch("code_team.agents.base.display")
+    async def test_stream_and_collect_response_writes_transcript(
+        self, mock_display: Mock, mock_live: Mock
+    ) -> None:
+        """Test that a transcript receives the output instead of memory."""
+        mock_live.return_value = MagicMock()
+        tool_block = ToolUseBlock(id="1", name="Write", input={"path": "a.py"})
+
+        async def mock_stream() -> AsyncIterator[Message]:
+            yield AssistantMessage(content=[TextBlock(text="Writing file")])
+            yield AssistantMessage(content=[tool_block])
+
+        transcript = io.StringIO()
+        result = await self.agent._stream_and_collect_response(
+            mock_stream(), transcript
+        )
+
+        assert result == ""
+        assert transcript.getvalue() == (
+            'Writing file\n[TOOL] Write: {"path": "a.py"}\n'
+        )
+
     @pytest.mark.asyncio
     async def test_run_method_abstract(self) -> None:
         """Test that run method is properly implemented in concrete class."""
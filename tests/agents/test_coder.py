@@ -0,0 +1,78 @@
+"""Unit tests for the Coder agent."""
+
+import tempfile
+from collections.abc import AsyncIterator
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from claude_code_sdk import AssistantMessage, Message, TextBlock
+
+from code_team.agents.coder import Coder
+from code_team.models.config import CodeTeamConfig, PathConfig
+from code_team.utils.llm import LLMProvider
+from code_team.utils.templates import TemplateManager
+
+
+class TestCoder:
+    """Test the Coder agent."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.mock_llm = Mock(spec=LLMProvider)
+        self.mock_templates = Mock(spec=TemplateManager)
+        self.mock_templates.render.return_value = "STATIC INSTRUCTIONS"
+        self.mock_config = Mock(spec=CodeTeamConfig)
+        self.mock_config.llm = Mock()
+        self.mock_config.llm.get_model_for_agent.return_value = "sonnet"
+        self.mock_config.paths = PathConfig()
+
+        self.coder = Coder(
+            llm_provider=self.mock_llm,
+            template_manager=self.mock_templates,
+            config=self.mock_config,
+            project_root=Path("/test/project"),
+        )
+
+    @pytest.mark.asyncio
+    async def test_run_streams_through_base_handler(self) -> None:
+        """Test that the Coder streams its response with the shared handler."""
+
+        async def mock_stream() -> AsyncIterator[Message]:
+            yield AssistantMessage(content=[TextBlock(text="Done")])
+
+        self.mock_llm.query.return_value = mock_stream()
+        self.coder._stream_and_collect_response = AsyncMock(return_value="Done")  # type: ignore[method-assign]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.coder.project_root = Path(tmpdir)
+            prompt_file = Path(tmpdir) / "task-001-prompt.md"
+            prompt_file.write_text("Do the task")
+
+            result = await self.coder.run(
+                coder_prompt=prompt_file,
+                verification_feedback="Tests failed",
+                plan_id="plan-0001",
+            )
+
+            log_file = Path(tmpdir) / ".codeteam" / "logs" / "CODER_LOG.md"
+            assert "## task-001-prompt.md" in log_file.read_text()
+            assert (log_file.parent / ".gitignore").read_text() == "*\n"
+
+        assert result is True
+        self.coder._stream_and_collect_response.assert_awaited_once()
+        transcript = self.coder._stream_and_collect_response.call_args.args[1]
+        assert transcript.name.endswith("CODER_LOG.md")
+        call_kwargs = self.mock_llm.query.call_args.kwargs
+        assert call_kwargs["system_prompt"] == (
+            "STATIC INSTRUCTIONS\n\n<TASK>\nDo the task\n</TASK>"
+        )
+        assert "Tests failed" in call_kwargs["prompt"]
+
+    @pytest.mark.asyncio
+    async def test_run_fails_without_prompt_file(self) -> None:
+        """Test that a missing prompt file aborts the run."""
+        result = await self.coder.run(coder_prompt=Path("/nonexistent/prompt.md"))
+
+        assert result is False
+        self.mock_llm.query.assert_not_called()
@@ -0,0 +1,80 @@
+"""Unit tests for the Committer agent."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from code_team.agents.committer import Committer
+from code_team.models.config import CodeTeamConfig
+from code_team.models.plan import Task
+from code_team.utils.llm import LLMProvider
+from code_team.utils.templates import TemplateManager
+
+
+class TestCommitter:
+    """Test the Committer agent."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.committer = Committer(
+            llm_provider=Mock(spec=LLMProvider),
+            template_manager=Mock(spec=TemplateManager),
+            config=Mock(spec=CodeTeamConfig),
+            project_root=Path("/test/project"),
+        )
+        self.task = Task(id="task-001", description="Add login")
+
+    async def _run_with_response(self, response: str) -> str:
+        self.committer._cached_query = AsyncMock(return_value=response)  # type: ignore[method-assign]
+        return await self.committer.run(self.task)
+
+    @pytest.mark.asyncio
+    async def test_plain_message_is_stripped(self) -> None:
+        """Test that a message without fences is returned trimmed."""
+        result = await self._run_with_response("\n feat: add login \n")
+
+        assert result == "feat: add login"
+
+    @pytest.mark.asyncio
+    async def test_fenced_message_is_extracted(self) -> None:
+        """Test that only the content of the code block is kept."""
+        response = (
+            "Here is the message:\n```text\nfeat: add login\n\nCloses: task-001\n```\n"
+            "Let me know if you need changes."
+        )
+
+        result = await self._run_with_response(response)
+
+        assert result == "feat: add login\n\nCloses: task-001"
+
+    @pytest.mark.asyncio
+    async def test_first_fenced_block_wins(self) -> None:
+        """Test that the first code block is used when several are present."""
+        response = "```\nfeat: first\n```\n```\nfeat: second\n```"
+
+        result = await self._run_with_response(response)
+
+        assert result == "feat: first"
+
+    @pytest.mark.asyncio
+    async def test_conventional_description_skips_llm(self) -> None:
+        """Test that a conventional-commit description is used directly."""
+        self.committer._cached_query = AsyncMock()  # type: ignore[method-assign]
+        task = Task(id="task-007", description="fix(api): handle empty payloads")
+
+        result = await self.committer.run(task)
+
+        assert result == "fix(api): handle empty payloads\n\nCloses: task-007"
+        self.committer._cached_query.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_plain_description_uses_llm(self) -> None:
+        """Test that free-form descriptions still go to the LLM."""
+        task = Task(id="task-008", description="Fix: the login page")
+        self.committer._cached_query = AsyncMock(return_value="fix: login page")  # type: ignore[method-assign]
+
+        result = await self.committer.run(task)
+
+        assert result == "fix: login page"
+        self.committer._cached_query.assert_awaited_once()
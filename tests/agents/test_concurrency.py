@@ -0,0 +1,61 @@
+"""Unit tests for bounded concurrent agent batches."""
+
+import asyncio
+
+import pytest
+
+from code_team.agents import _concurrency
+
+
+class TestRunBatch:
+    """Test the run_batch helper."""
+
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self) -> None:
+        """Test that results are returned in the order the calls were given."""
+
+        async def delayed(value: int) -> int:
+            await asyncio.sleep(0.01 * (3 - value))
+            return value
+
+        results = await _concurrency.run_batch((delayed(i) for i in range(3)), limit=5)
+
+        assert results == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_exceptions_are_returned(self) -> None:
+        """Test that a failing call does not abort the batch."""
+
+        async def fail() -> int:
+            raise ValueError("boom")
+
+        async def succeed() -> int:
+            return 1
+
+        results = await _concurrency.run_batch([fail(), succeed()], limit=5)
+
+        assert isinstance(results[0], ValueError)
+        assert results[1] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self) -> None:
+        """Test that no more calls than the semaphore allows run at once."""
+        in_flight = 0
+        peak = 0
+
+        async def track() -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        await _concurrency.run_batch((track() for _ in range(6)), limit=2)
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_limit_must_be_positive(self) -> None:
+        """Test that a limit below 1 is rejected instead of hanging the batch."""
+        with pytest.raises(ValueError, match="at least 1"):
+            await _concurrency.run_batch([], limit=0)
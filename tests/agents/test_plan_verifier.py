@@ -0,0 +1,46 @@
+"""Unit tests for the PlanVerifier agent."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from code_team.agents.plan_verifier import PlanVerifier
+from code_team.models.config import CodeTeamConfig
+from code_team.utils.llm import LLMProvider
+from code_team.utils.templates import TemplateManager
+
+
+class TestPlanVerifier:
+    """Test the PlanVerifier agent."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.verifier = PlanVerifier(
+            llm_provider=Mock(spec=LLMProvider),
+            template_manager=Mock(spec=TemplateManager),
+            config=Mock(spec=CodeTeamConfig),
+            project_root=Path("/test/project"),
+        )
+
+    @pytest.mark.asyncio
+    async def test_empty_plan_skips_llm(self) -> None:
+        """Test that an empty plan gets canned feedback without an LLM call."""
+        self.verifier._cached_query = AsyncMock()  # type: ignore[method-assign]
+
+        result = await self.verifier.run(plan_content="  \n", acceptance_criteria="")
+
+        assert result == "Plan is empty."
+        self.verifier._cached_query.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_plan_is_reviewed(self) -> None:
+        """Test that a non-empty plan is sent for review."""
+        self.verifier._cached_query = AsyncMock(return_value="  Looks good.  ")  # type: ignore[method-assign]
+
+        result = await self.verifier.run(
+            plan_content="plan_id: plan-0001\ntasks: []", acceptance_criteria="- Works"
+        )
+
+        assert result == "Looks good."
+        self.verifier._cached_query.assert_awaited_once()
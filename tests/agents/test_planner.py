@@ -0,0 +1,134 @@
+"""Unit tests for the Planner agent's conversation handling."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from code_team.agents.planner import Planner
+from code_team.models.config import CodeTeamConfig
+from code_team.utils.llm import LLMProvider
+from code_team.utils.templates import TemplateManager
+
+PLAN_RESPONSE = "```yaml\nplan_id: p\n```\n===FILE_SEPARATOR===\n```markdown\n- ok\n```"
+
+
+class TestPlannerHistory:
+    """Test summarization of long planning conversations."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.planner = Planner(
+            llm_provider=Mock(spec=LLMProvider),
+            template_manager=Mock(spec=TemplateManager),
+            config=Mock(spec=CodeTeamConfig),
+            project_root=Path("/test/project"),
+        )
+
+    @pytest.mark.asyncio
+    @patch("code_team.agents.planner.interactive")
+    @patch("code_team.agents.planner.display")
+    async def test_long_history_is_replaced_by_summary(
+        self, mock_display: Mock, mock_interactive: Mock
+    ) -> None:
+        """Test that older turns are condensed once the window is exceeded."""
+        turns = Planner._HISTORY_WINDOW + 2
+        responses = [f"Question {i}?" for i in range(turns)] + [PLAN_RESPONSE]
+        prompts: list[str] = []
+
+        async def respond(system_prompt: str, prompt: str) -> str:
+            prompts.append(prompt)
+            await asyncio.sleep(0)  # Let the background summary finish
+            return responses[len(prompts) - 1]
+
+        self.planner._get_planner_response = AsyncMock(side_effect=respond)  # type: ignore[method-assign]
+        self.planner._summarize = AsyncMock(return_value="Earlier turns")  # type: ignore[method-assign]
+        mock_interactive.get_text_input.side_effect = [
+            f"Answer {i}" for i in range(turns)
+        ]
+
+        result = await self.planner.run(initial_request="Build a login page")
+
+        assert "plan.yml" in result
+        self.planner._summarize.assert_awaited_once()
+        summarized = self.planner._summarize.call_args.args[0]
+        assert summarized[0] == "Planner: Question 0?"
+        assert prompts[-1].startswith(
+            "User request: Build a login page\n[SUMMARY] Earlier turns\n"
+        )
+        assert "Question 0?" not in prompts[-1]
+
+    @pytest.mark.asyncio
+    @patch("code_team.agents.planner.interactive")
+    @patch("code_team.agents.planner.display")
+    async def test_short_history_is_not_summarized(
+        self, mock_display: Mock, mock_interactive: Mock
+    ) -> None:
+        """Test that short conversations are sent verbatim."""
+        self.planner._get_planner_response = AsyncMock(  # type: ignore[method-assign]
+            side_effect=["Question?", PLAN_RESPONSE]
+        )
+        self.planner._summarize = AsyncMock()  # type: ignore[method-assign]
+        mock_interactive.get_text_input.return_value = "Answer"
+
+        await self.planner.run(initial_request="Build a login page")
+
+        self.planner._summarize.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("code_team.agents.planner.interactive")
+    @patch("code_team.agents.planner.display")
+    async def test_pending_summary_does_not_block_turns(
+        self, mock_display: Mock, mock_interactive: Mock
+    ) -> None:
+        """Test that turns continue with the full history until a summary is ready."""
+        turns = Planner._HISTORY_WINDOW + 2
+        responses = [f"Question {i}?" for i in range(turns)] + [PLAN_RESPONSE]
+        prompts: list[str] = []
+        summary_started = asyncio.Event()
+        summary_cancelled = False
+
+        async def respond(system_prompt: str, prompt: str) -> str:
+            prompts.append(prompt)
+            await asyncio.sleep(0)
+            return responses[len(prompts) - 1]
+
+        async def never_finishes(lines: list[str]) -> str:
+            nonlocal summary_cancelled
+            summary_started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                summary_cancelled = True
+                raise
+            return "unreachable"
+
+        self.planner._get_planner_response = AsyncMock(side_effect=respond)  # type: ignore[method-assign]
+        self.planner._summarize = never_finishes  # type: ignore[method-assign]
+        mock_interactive.get_text_input.side_effect = [
+            f"Answer {i}" for i in range(turns)
+        ]
+
+        result = await self.planner.run(initial_request="Build a login page")
+        await asyncio.sleep(0)  # Let the cancellation reach the summary
+
+        assert "plan.yml" in result
+        assert summary_started.is_set()
+        assert summary_cancelled
+        assert "[SUMMARY]" not in prompts[-1]
+        assert "Planner: Question 0?" in prompts[-1]
+
+    def test_failed_summary_keeps_history(self) -> None:
+        """Test that a failed summary leaves the history untouched."""
+
+        async def scenario() -> list[str]:
+            async def fail() -> str:
+                raise RuntimeError("boom")
+
+            task = asyncio.create_task(fail())
+            await asyncio.gather(task, return_exceptions=True)
+            with patch("code_team.agents.planner.display"):
+                return self.planner._apply_summary(["a", "b", "c"], task, 2)
+
+        assert asyncio.run(scenario()) == ["a", "b", "c"]
@@ -0,0 +1,113 @@
+"""Unit tests for stream message dispatch."""
+
+from unittest.mock import Mock
+
+from claude_code_sdk import (
+    AssistantMessage,
+    ResultMessage,
+    TextBlock,
+    ToolUseBlock,
+    UserMessage,
+)
+
+from code_team.agents._stream import StreamState, handle_message
+
+
+class TestHandleMessage:
+    """Test the handle_message dispatcher."""
+
+    def test_text_is_collected_and_escaped(self) -> None:
+        """Test that raw text is kept for the response and escaped for display."""
+        state = StreamState()
+
+        handle_message(AssistantMessage(content=[TextBlock(text="a [b]")]), state)
+
+        assert state.response_parts == ["a [b]"]
+        assert state.pending_lines == ["a [[b]]"]
+        assert not state.flush_due
+
+    def test_tool_use_requests_flush(self) -> None:
+        """Test that a tool use is shown with its inputs and triggers a redraw."""
+        state = StreamState()
+        block = ToolUseBlock(id="1", name="Read", input={"path": "a.py"})
+
+        handle_message(AssistantMessage(content=[block]), state)
+
+        assert len(state.pending_lines) == 2
+        assert "Read" in state.pending_lines[0]
+        assert "a.py" in state.pending_lines[1]
+        assert state.flush_due
+
+    def test_error_result_requests_flush(self) -> None:
+        """Test that an error result is displayed immediately."""
+        state = StreamState()
+        result = ResultMessage(
+            subtype="error_max_turns",
+            duration_ms=1,
+            duration_api_ms=1,
+            is_error=True,
+            num_turns=1,
+            session_id="test",
+        )
+
+        handle_message(result, state)
+
+        assert "error_max_turns" in state.pending_lines[0]
+        assert state.flush_due
+
+    def test_unhandled_message_is_ignored(self) -> None:
+        """Test that message types without a handler leave the state unchanged."""
+        state = StreamState()
+
+        handle_message(UserMessage(content="hello"), state)
+
+        assert state.pending_lines == []
+        assert state.response_parts == []
+
+    def test_spec_mocks_fall_back_to_isinstance(self) -> None:
+        """Test that objects that only pass isinstance are still dispatched."""
+        state = StreamState()
+        block = Mock(spec=TextBlock)
+        block.text = "mocked"
+        message = Mock(spec=AssistantMessage)
+        message.content = [block]
+
+        handle_message(message, state)
+
+        assert state.response_parts == ["mocked"]
+
+    def test_buffer_limit_requests_flush(self) -> None:
+        """Test that a full buffer requests a redraw and flush resets it."""
+        state = StreamState(flush_chars=5)
+
+        handle_message(AssistantMessage(content=[TextBlock(text="123456")]), state)
+        assert state.flush_due
+
+        state.flush()
+        assert state.display_lines == ["123456"]
+        assert state.pending_lines == []
+        assert state.pending_chars == 0
+        assert not state.flush_due
+
+    def test_transcript_output_is_queued_for_the_caller(self) -> None:
+        """Test that transcript output is queued instead of kept in the response."""
+        state = StreamState(to_transcript=True)
+        block = ToolUseBlock(id="1", name="Read", input={"path": "a.py"})
+
+        handle_message(AssistantMessage(content=[TextBlock(text="Reading")]), state)
+        handle_message(AssistantMessage(content=[block]), state)
+
+        assert state.response_parts == []
+        assert state.take_transcript() == ('Reading\n[TOOL] Read: {"path": "a.py"}\n')
+        assert state.transcript_parts == []
+
+    def test_transcript_display_keeps_a_bounded_preview(self) -> None:
+        """Test that only a short, recent preview is displayed with a transcript."""
+        state = StreamState(to_transcript=True, preview_chars=5, preview_lines=2)
+
+        for text in ["first", "second", "a much longer block"]:
+            handle_message(AssistantMessage(content=[TextBlock(text=text)]), state)
+            state.flush()
+
+        assert state.display_lines == ["secon…", "a muc…"]
+        assert state.take_transcript() == "firstseconda much longer block"
@@ -0,0 +1,43 @@
+"""Unit tests for the Summarizer agent."""
+
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from code_team.agents.summarizer import Summarizer
+from code_team.models.config import CodeTeamConfig, LLMConfig
+from code_team.utils.llm import LLMProvider
+from code_team.utils.templates import TemplateManager
+
+
+class TestSummarizer:
+    """Test the Summarizer agent."""
+
+    @pytest.mark.asyncio
+    async def test_run_collects_text_with_summarizer_model(self) -> None:
+        """Test that the summary text is collected using the summarizer model."""
+        mock_llm = Mock(spec=LLMProvider)
+        mock_templates = Mock(spec=TemplateManager)
+        mock_templates.render.return_value = "Summarize"
+        mock_config = Mock(spec=CodeTeamConfig)
+        mock_config.llm = LLMConfig()
+
+        async def mock_stream(**kwargs: Any) -> AsyncIterator[str]:
+            yield " The user wants "
+            yield "a login page. "
+
+        mock_llm.query_text.side_effect = mock_stream
+        summarizer = Summarizer(
+            mock_llm, mock_templates, mock_config, Path("/test/project")
+        )
+
+        summary = await summarizer.run(transcript="User: I want a login page")
+
+        assert summary == "The user wants a login page."
+        call_kwargs = mock_llm.query_text.call_args.kwargs
+        assert call_kwargs["model"] == "haiku"
+        assert "User: I want a login page" in call_kwargs["prompt"]
+        mock_templates.render.assert_called_once_with("SUMMARIZER_INSTRUCTIONS.md")
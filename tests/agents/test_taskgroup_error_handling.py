@@ -269,8 +269,8 @@ class TestPlannerSpecificErrorHandling:
     async def test_planner_get_response_uses_robust_query(
         self, test_agent: Planner, mock_llm_provider: Mock
     ) -> None:
-        """Test that planner's _get_planner_response uses the robust query method."""
-        mock_llm_provider.query.return_value = mock_llm_stream_success()
+        """Test that planner's _get_planner_response uses the cached robust query."""
+        mock_llm_provider.cached_query.return_value = mock_llm_stream_success()
 
         response = await test_agent._get_planner_response(
             system_prompt="Test system prompt", prompt="Test prompt"
@@ -278,7 +278,7 @@ class TestPlannerSpecificErrorHandling:
 
         assert response is not None
         assert len(response) > 0
-        mock_llm_provider.query.assert_called_once()
+        mock_llm_provider.cached_query.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_planner_parse_plan_files(
@@ -0,0 +1,67 @@
+"""Unit tests for the CodeVerifier agent."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from code_team.agents.verifiers import CodeVerifier
+from code_team.models.config import CodeTeamConfig
+from code_team.models.plan import Task
+from code_team.utils.llm import LLMProvider
+from code_team.utils.templates import TemplateManager
+
+
+class TestCodeVerifier:
+    """Test the CodeVerifier agent."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.templates = Mock(spec=TemplateManager)
+        self.templates.render.return_value = "instructions"
+        self.verifier = CodeVerifier(
+            "task_completion",
+            llm_provider=Mock(spec=LLMProvider),
+            template_manager=self.templates,
+            config=Mock(spec=CodeTeamConfig),
+            project_root=Path("/test/project"),
+        )
+
+    def test_unknown_verifier_type(self) -> None:
+        """Test that an unknown verifier type is rejected."""
+        with pytest.raises(ValueError, match="Unknown verifier type"):
+            CodeVerifier(
+                "style",
+                llm_provider=Mock(spec=LLMProvider),
+                template_manager=self.templates,
+                config=Mock(spec=CodeTeamConfig),
+                project_root=Path("/test/project"),
+            )
+
+    @pytest.mark.asyncio
+    async def test_system_prompt_is_task_independent(self) -> None:
+        """Test that task details go in the user prompt, not the system prompt."""
+        self.verifier._robust_llm_query = AsyncMock(return_value=" PASS ")  # type: ignore[method-assign]
+        task = Task(id="task-001", description="Add a login form")
+
+        result = await self.verifier.run(task=task, diff="+ form")
+
+        assert result == "PASS"
+        self.templates.render.assert_called_once_with("VERIFIER_TASK_INSTRUCTIONS.md")
+        kwargs = self.verifier._robust_llm_query.call_args.kwargs
+        assert kwargs["system_prompt"] == "instructions"
+        assert "Task ID: task-001" in kwargs["prompt"]
+        assert "Add a login form" in kwargs["prompt"]
+
+    @pytest.mark.asyncio
+    async def test_prebuilt_prompt_is_sent_as_is(self) -> None:
+        """Test that a shared prompt from build_prompt is used unchanged."""
+        self.verifier._robust_llm_query = AsyncMock(return_value="PASS")  # type: ignore[method-assign]
+        task = Task(id="task-001", description="Add a login form")
+        prompt = CodeVerifier.build_prompt(task, "+ form")
+
+        await self.verifier.run(task=task, prompt=prompt)
+
+        kwargs = self.verifier._robust_llm_query.call_args.kwargs
+        assert kwargs["prompt"] is prompt
+        assert "+ form" in prompt
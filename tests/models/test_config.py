@@ -1,9 +1,12 @@
 """Unit tests for configuration models."""
 
+from typing import Any
+
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from code_team.models.config import (
+    CacheConfig,
     CodeTeamConfig,
     LLMConfig,
     PathConfig,
@@ -14,36 +17,50 @@ from code_team.models.config import (
     VerifierInstances,
 )
 
+# Built once so the ValidationError tests reuse the same validator
+_VERIFICATION_COMMAND = TypeAdapter(VerificationCommand)
+
 
 class TestLLMConfig:
     """Test the LLMConfig model."""
 
-    def test_default_agent_models(self) -> None:
-        """Test that LLMConfig has correct default models for all agents."""
-        config = LLMConfig()
-        assert config.planner == "sonnet"
-        assert config.coder == "sonnet"
-        assert config.prompter == "sonnet"
-        assert config.plan_verifier == "sonnet"
-        assert config.verifier_arch == "sonnet"
-        assert config.verifier_task == "sonnet"
-        assert config.verifier_sec == "sonnet"
-        assert config.verifier_perf == "sonnet"
-        assert config.commit_agent == "sonnet"
-
-    def test_custom_agent_models(self) -> None:
-        """Test that LLMConfig accepts custom models for agents."""
-        config = LLMConfig(
-            planner="opus",
-            coder="haiku",
-            verifier_arch="sonnet",
-        )
-        assert config.planner == "opus"
-        assert config.coder == "haiku"
-        assert config.verifier_arch == "sonnet"
-        # Others should still be defaults
-        assert config.prompter == "sonnet"
-        assert config.plan_verifier == "sonnet"
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            (
+                {},
+                {
+                    "planner": "sonnet",
+                    "coder": "sonnet",
+                    "prompter": "sonnet",
+                    "plan_verifier": "sonnet",
+                    "verifier_arch": "sonnet",
+                    "verifier_task": "sonnet",
+                    "verifier_sec": "sonnet",
+                    "verifier_perf": "sonnet",
+                    "commit_agent": "sonnet",
+                },
+            ),
+            (
+                {"planner": "opus", "coder": "haiku", "verifier_arch": "sonnet"},
+                {
+                    "planner": "opus",
+                    "coder": "haiku",
+                    "verifier_arch": "sonnet",
+                    # Others should still be defaults
+                    "prompter": "sonnet",
+                    "plan_verifier": "sonnet",
+                },
+            ),
+        ],
+        ids=["default", "custom"],
+    )
+    def test_agent_models(
+        self, kwargs: dict[str, Any], expected: dict[str, str]
+    ) -> None:
+        """Test LLMConfig's default agent models and custom overrides."""
+        config = LLMConfig(**kwargs)
+        assert config.model_dump(include=set(expected)) == expected
 
     def test_get_model_for_agent(self) -> None:
         """Test the get_model_for_agent method."""
@@ -71,26 +88,30 @@ class TestVerificationCommand:
 
     def test_verification_command_requires_fields(self) -> None:
         """Test that VerificationCommand requires all fields."""
-        with pytest.raises(ValidationError):
-            VerificationCommand(**{"name": "pytest"})
-        with pytest.raises(ValidationError):
-            VerificationCommand(**{"command": "pytest tests/"})
+        with pytest.raises(ValidationError, match=r"command\s+Field required"):
+            _VERIFICATION_COMMAND.validate_python({"name": "pytest"})
+        with pytest.raises(ValidationError, match=r"name\s+Field required"):
+            _VERIFICATION_COMMAND.validate_python({"command": "pytest tests/"})
 
 
 class TestVerificationMetrics:
     """Test the VerificationMetrics model."""
 
-    def test_default_metrics(self) -> None:
-        """Test that VerificationMetrics has correct defaults."""
-        metrics = VerificationMetrics()
-        assert metrics.max_file_lines == 500
-        assert metrics.max_method_lines == 80
-
-    def test_custom_metrics(self) -> None:
-        """Test that VerificationMetrics accepts custom values."""
-        metrics = VerificationMetrics(max_file_lines=1000, max_method_lines=100)
-        assert metrics.max_file_lines == 1000
-        assert metrics.max_method_lines == 100
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            ({}, {"max_file_lines": 500, "max_method_lines": 80}),
+            (
+                {"max_file_lines": 1000, "max_method_lines": 100},
+                {"max_file_lines": 1000, "max_method_lines": 100},
+            ),
+        ],
+        ids=["default", "custom"],
+    )
+    def test_metrics(self, kwargs: dict[str, Any], expected: dict[str, int]) -> None:
+        """Test VerificationMetrics' defaults and custom values."""
+        metrics = VerificationMetrics(**kwargs)
+        assert metrics.model_dump() == expected
 
 
 class TestVerificationConfig:
@@ -98,9 +119,11 @@ class TestVerificationConfig:
 
     def test_default_verification_config(self) -> None:
         """Test that VerificationConfig has correct defaults."""
-        config = VerificationConfig()
+        config = VerificationConfig.model_construct()
         assert config.commands == []
-        assert isinstance(config.metrics, VerificationMetrics)
+        assert type(config.metrics) is VerificationMetrics
+        assert config.timeout_seconds == 600.0
+        assert config.max_concurrency == 5
 
     def test_custom_verification_config(self) -> None:
         """Test that VerificationConfig accepts custom values."""
@@ -111,27 +134,48 @@ class TestVerificationConfig:
         assert config.commands[0].name == "test"
         assert config.metrics.max_file_lines == 600
 
+    def test_max_concurrency_must_be_positive(self) -> None:
+        """Test that a verifier concurrency below 1 is rejected."""
+        with pytest.raises(ValidationError):
+            VerificationConfig(max_concurrency=0)
+
 
 class TestVerifierInstances:
     """Test the VerifierInstances model."""
 
-    def test_default_instances(self) -> None:
-        """Test that VerifierInstances has correct defaults."""
-        instances = VerifierInstances()
-        assert instances.architecture == 1
-        assert instances.task_completion == 1
-        assert instances.security == 0
-        assert instances.performance == 0
-
-    def test_custom_instances(self) -> None:
-        """Test that VerifierInstances accepts custom values."""
-        instances = VerifierInstances(
-            architecture=2, task_completion=3, security=1, performance=1
-        )
-        assert instances.architecture == 2
-        assert instances.task_completion == 3
-        assert instances.security == 1
-        assert instances.performance == 1
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            (
+                {},
+                {
+                    "architecture": 1,
+                    "task_completion": 1,
+                    "security": 0,
+                    "performance": 0,
+                },
+            ),
+            (
+                {
+                    "architecture": 2,
+                    "task_completion": 3,
+                    "security": 1,
+                    "performance": 1,
+                },
+                {
+                    "architecture": 2,
+                    "task_completion": 3,
+                    "security": 1,
+                    "performance": 1,
+                },
+            ),
+        ],
+        ids=["default", "custom"],
+    )
+    def test_instances(self, kwargs: dict[str, Any], expected: dict[str, int]) -> None:
+        """Test VerifierInstances' defaults and custom values."""
+        instances = VerifierInstances(**kwargs)
+        assert instances.model_dump() == expected
 
 
 class TestPathConfig:
@@ -139,7 +183,7 @@ class TestPathConfig:
 
     def test_default_paths(self) -> None:
         """Test that PathConfig has correct defaults."""
-        config = PathConfig()
+        config = PathConfig.model_construct()
         assert config.plan_dir == ".codeteam/planning"
         assert config.report_dir == ".codeteam/reports"
         assert config.config_dir == ".codeteam"
@@ -164,13 +208,14 @@ class TestCodeTeamConfig:
 
     def test_default_config(self) -> None:
         """Test that CodeTeamConfig has correct defaults."""
-        config = CodeTeamConfig()
-        assert config.version == 1.0
-        assert isinstance(config.llm, LLMConfig)
-        assert isinstance(config.verification, VerificationConfig)
-        assert isinstance(config.verifier_instances, VerifierInstances)
-        assert isinstance(config.paths, PathConfig)
-        assert isinstance(config.templates, TemplateConfig)
+        config = CodeTeamConfig.model_construct()
+        assert config.version == 1
+        assert type(config.llm) is LLMConfig
+        assert type(config.verification) is VerificationConfig
+        assert type(config.verifier_instances) is VerifierInstances
+        assert type(config.paths) is PathConfig
+        assert type(config.templates) is TemplateConfig
+        assert type(config.cache) is CacheConfig
 
     def test_custom_config(self) -> None:
         """Test that CodeTeamConfig accepts custom values."""
@@ -182,27 +227,43 @@ class TestCodeTeamConfig:
         paths = PathConfig(plan_dir="custom/plans")
 
         config = CodeTeamConfig(
-            version=2.0,
+            version=2,
             llm=llm,
             verification=verification,
             verifier_instances=verifier_instances,
             paths=paths,
         )
 
-        assert config.version == 2.0
+        assert config.version == 2
         assert config.llm.planner == "opus"
         assert config.llm.coder == "haiku"
         assert len(config.verification.commands) == 1
         assert config.verifier_instances.security == 1
         assert config.paths.plan_dir == "custom/plans"
 
+    def test_float_version_is_accepted(self) -> None:
+        """Test that configs written with version: 1.0 still load."""
+        config = CodeTeamConfig.model_validate({"version": 1.0})
+        assert config.version == 1
+        assert type(config.version) is int
+
+
+class TestCacheConfig:
+    """Test the CacheConfig model."""
+
+    def test_cache_is_off_by_default(self) -> None:
+        """Test that responses are not replayed unless caching is enabled."""
+        config = CacheConfig()
+        assert config.enabled is False
+        assert config.backend == "json"
+
 
 class TestTemplateConfig:
     """Test the TemplateConfig model."""
 
     def test_default_template_config(self) -> None:
         """Test that TemplateConfig has correct defaults."""
-        config = TemplateConfig()
+        config = TemplateConfig.model_construct()
         assert config.guideline_files == [
             "ARCHITECTURE_GUIDELINES.md",
             "CODING_GUIDELINES.md",
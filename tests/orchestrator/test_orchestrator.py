@@ -1,6 +1,11 @@
 """Tests for the Orchestrator class, focusing on plan selection and progress tracking."""
 
+import asyncio
+import os
+import shlex
+import sys
 import tempfile
+import threading
 from collections.abc import Generator
 from pathlib import Path
 from typing import Any
@@ -8,8 +13,12 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from code_team.agents.coder import Coder
+from code_team.agents.prompter import Prompter
+from code_team.models.config import VerificationCommand
 from code_team.models.plan import Plan, Task
 from code_team.orchestrator.orchestrator import Orchestrator
+from code_team.orchestrator.scheduler import TaskScheduler
 
 
 @pytest.fixture
@@ -56,16 +65,18 @@ def orchestrator(temp_project_root: tuple[Path, Path]) -> Orchestrator:
 class TestPlanSelection:
     """Test plan selection functionality."""
 
-    def test_select_plan_interactively_no_plans(
+    @pytest.mark.asyncio
+    async def test_select_plan_interactively_no_plans(
         self, orchestrator: Orchestrator
     ) -> None:
         """Test behavior when no plans exist."""
         with patch("code_team.utils.ui.display.error") as mock_error:
-            result = orchestrator._select_plan_interactively()
+            result = await orchestrator._select_plan_interactively()
             assert result is None
             mock_error.assert_called_once_with("No plans found in .codeteam/planning.")
 
-    def test_select_plan_interactively_with_plans(
+    @pytest.mark.asyncio
+    async def test_select_plan_interactively_with_plans(
         self, orchestrator: Orchestrator, temp_project_root: tuple[Path, Path]
     ) -> None:
         """Test plan selection when plans exist."""
@@ -100,12 +111,13 @@ tasks:
             # Mock user selection
             mock_choice.return_value = "plan-0001: Test plan description"
 
-            result = orchestrator._select_plan_interactively()
+            result = await orchestrator._select_plan_interactively()
 
             assert result == mock_plan
             mock_choice.assert_called_once()
 
-    def test_select_plan_interactively_invalid_plans(
+    @pytest.mark.asyncio
+    async def test_select_plan_interactively_invalid_plans(
         self, orchestrator: Orchestrator, temp_project_root: tuple[Path, Path]
     ) -> None:
         """Test behavior when plan files exist but are invalid."""
@@ -117,12 +129,37 @@ tasks:
         (plan_dir / "plan.yml").write_text("invalid yaml content: [")
 
         with patch("code_team.utils.ui.display.error") as mock_error:
-            result = orchestrator._select_plan_interactively()
+            result = await orchestrator._select_plan_interactively()
             assert result is None
             mock_error.assert_called_once_with(
                 "No valid plans found in .codeteam/planning."
             )
 
+    @pytest.mark.asyncio
+    async def test_select_plan_interactively_lists_newest_first(
+        self, orchestrator: Orchestrator, temp_project_root: tuple[Path, Path]
+    ) -> None:
+        """Test that plans are offered newest first and stray files are ignored."""
+        project_root, _ = temp_project_root
+        planning = project_root / ".codeteam" / "planning"
+        (planning / "notes.txt").write_text("not a plan")
+        for index, plan_id in enumerate(["plan-0001", "plan-0002"]):
+            plan_dir = planning / plan_id
+            plan_dir.mkdir()
+            (plan_dir / "plan.yml").write_text(
+                f"plan_id: {plan_id}\ndescription: d\ntasks: []\n"
+            )
+            mtime_ns = (index + 1) * 1_000_000_000
+            os.utime(plan_dir, ns=(mtime_ns, mtime_ns))
+
+        with patch("code_team.utils.ui.interactive.get_menu_choice") as mock_choice:
+            mock_choice.return_value = "plan-0001: d"
+            result = await orchestrator._select_plan_interactively()
+
+        assert result is not None
+        assert result.plan_id == "plan-0001"
+        assert mock_choice.call_args.args[1] == ["plan-0002: d", "plan-0001: d"]
+
 
 class TestReportManagement:
     """Test verification report management."""
@@ -209,6 +246,65 @@ class TestReportManagement:
             )
             assert report_call is not None
 
+    @pytest.mark.asyncio
+    async def test_rejection_feedback_reuses_report_in_memory(
+        self, orchestrator: Orchestrator, temp_project_root: tuple[Path, Path]
+    ) -> None:
+        """Test that rejection feedback is appended without re-reading the report."""
+        project_root, _ = temp_project_root
+        plan = Plan(
+            plan_id="test-plan",
+            description="Test plan",
+            tasks=[Task(id="task-001", description="Test task")],
+        )
+        task = plan.tasks[0]
+        mock_coder = AsyncMock()
+
+        def create_agent_side_effect(agent_class: type) -> Any:
+            if agent_class is Coder:
+                return mock_coder
+            prompter = AsyncMock()
+            prompter.run.return_value = Path("/mock/path/task-001-prompt.md")
+            return prompter
+
+        with (
+            patch.object(orchestrator, "_run_verification") as mock_verify,
+            patch.object(orchestrator, "_get_user_decision") as mock_decision,
+            patch.object(
+                orchestrator, "_create_agent", side_effect=create_agent_side_effect
+            ),
+            patch.object(orchestrator, "_commit_changes"),
+            patch("code_team.utils.filesystem.read_file") as mock_read,
+            patch("code_team.utils.ui.display.panel"),
+            patch("code_team.utils.ui.display.info"),
+            patch("code_team.utils.ui.display.warning"),
+            patch(
+                "code_team.utils.ui.interactive.get_menu_choice",
+                return_value="Proceed",
+            ),
+        ):
+            mock_verify.side_effect = ["First report", "Second report"]
+            mock_decision.side_effect = [
+                "/reject_changes Please add tests",
+                "/accept_changes",
+            ]
+
+            await orchestrator._execute_task_cycle(plan, task, MagicMock(), MagicMock())
+
+        mock_read.assert_not_called()
+        expected_feedback = (
+            "First report\n\n--- User Feedback (Attempt 1) ---\nPlease add tests"
+        )
+        assert (
+            mock_coder.run.call_args_list[1].kwargs["verification_feedback"]
+            == expected_feedback
+        )
+        report_file = (
+            project_root / ".codeteam" / "reports" / "test-plan" / "task-001.md"
+        )
+        assert report_file.read_text() == "Second report"
+        assert task.status == "completed"
+
     @pytest.mark.asyncio
     async def test_delete_report_after_commit(
         self, orchestrator: Orchestrator, temp_project_root: tuple[Path, Path]
@@ -233,8 +329,14 @@ class TestReportManagement:
             patch.object(orchestrator, "_create_agent") as mock_create_agent,
             patch("code_team.utils.git.commit_changes") as mock_commit,
         ):
-            # Mock successful commit
-            mock_commit.return_value = True
+            # Mock successful commit, recording the thread git runs on
+            commit_threads: list[threading.Thread] = []
+
+            def fake_commit(*args: Any) -> bool:
+                commit_threads.append(threading.current_thread())
+                return True
+
+            mock_commit.side_effect = fake_commit
 
             # Mock the committer agent
             mock_committer = AsyncMock()
@@ -245,6 +347,9 @@ class TestReportManagement:
 
             # Verify the report file was deleted
             assert not report_file.exists()
+            # git runs in a worker thread, off the event loop
+            (commit_thread,) = commit_threads
+            assert commit_thread is not threading.main_thread()
 
 
 class TestProgressTracking:
@@ -275,7 +380,6 @@ tasks:
         with (
             patch.object(orchestrator, "_select_plan_interactively") as mock_select,
             patch.object(orchestrator, "_execute_task_cycle") as mock_execute,
-            patch.object(orchestrator, "_get_latest_plan") as mock_get_latest,
             patch(
                 "code_team.orchestrator.orchestrator.Progress"
             ) as mock_progress_class,
@@ -296,9 +400,6 @@ tasks:
             )
             mock_select.return_value = test_plan
 
-            # Mock _get_latest_plan to return updated plan
-            mock_get_latest.return_value = test_plan
-
             # Mock progress instance
             mock_progress = MagicMock()
             mock_progress_class.return_value = mock_progress
@@ -321,3 +422,296 @@ tasks:
             mock_execute.assert_called_once()
             call_args = mock_execute.call_args
             assert call_args[0][2] == mock_progress  # progress parameter
+
+
+class TestUserDecision:
+    """Test the verification review prompt."""
+
+    @pytest.mark.asyncio
+    async def test_rejection_feedback_is_appended(
+        self, orchestrator: Orchestrator
+    ) -> None:
+        """Test that rejection feedback is collected off the event loop."""
+        with (
+            patch(
+                "code_team.utils.ui.interactive.get_menu_choice",
+                return_value="/reject_changes",
+            ),
+            patch(
+                "code_team.utils.ui.interactive.get_text_input",
+                return_value="  Add tests  ",
+            ),
+        ):
+            decision = await orchestrator._get_user_decision()
+
+        assert decision == "/reject_changes Add tests"
+
+
+class TestVerification:
+    """Test the verification step."""
+
+    def test_active_verifiers_resolved_from_config(
+        self, orchestrator: Orchestrator
+    ) -> None:
+        """Test that only verifier types with instances are run."""
+        assert orchestrator._active_verifiers == ["architecture", "task_completion"]
+
+    @pytest.mark.asyncio
+    async def test_agent_verifiers_run_concurrently(
+        self, orchestrator: Orchestrator
+    ) -> None:
+        """Test that verifiers overlap and a failing verifier is reported."""
+        task = Task(id="task-001", description="Test task")
+        orchestrator._active_verifiers = [
+            "architecture",
+            "task_completion",
+            "security",
+        ]
+        running = 0
+        peak = 0
+
+        async def fake_run(self: Any, task: Task, prompt: str, live: bool) -> str:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            if self.verifier_type == "security":
+                raise RuntimeError("boom")
+            return f"{self.verifier_type}: PASS"
+
+        with (
+            patch("code_team.utils.git.get_git_diff", return_value="+ change"),
+            patch("code_team.utils.ui.display.info"),
+            patch(
+                "code_team.orchestrator.orchestrator.CodeVerifier.run",
+                autospec=True,
+                side_effect=fake_run,
+            ) as mock_run,
+        ):
+            report = await orchestrator._run_verification(task)
+
+        assert peak == 3
+        assert "+ change" in mock_run.call_args.kwargs["prompt"]
+        # Concurrent verifiers must not each open a Live panel
+        assert all(not call.kwargs["live"] for call in mock_run.call_args_list)
+        assert "## Verifier: Architecture\n\narchitecture: PASS" in report
+        assert "## Verifier: Task_Completion\n\ntask_completion: PASS" in report
+        assert "## Verifier: Security\n\nERROR" in report
+        assert "boom" in report
+
+    @pytest.mark.asyncio
+    async def test_commands_overlap_with_agent_verifiers(
+        self, orchestrator: Orchestrator
+    ) -> None:
+        """Test that commands run while the agent verifiers review the diff."""
+        orchestrator._active_verifiers = ["architecture"]
+        orchestrator.config.verification.commands = [
+            VerificationCommand(name="lint", command="lint")
+        ]
+        verifier_started = asyncio.Event()
+
+        async def fake_command(cmd_config: VerificationCommand) -> str:
+            await asyncio.wait_for(verifier_started.wait(), timeout=1)
+            return f"- **{cmd_config.name}:** PASS"
+
+        async def fake_run(self: Any, task: Task, prompt: str, live: bool) -> str:
+            verifier_started.set()
+            return "PASS"
+
+        with (
+            patch("code_team.utils.git.get_git_diff", return_value="+ change"),
+            patch("code_team.utils.ui.display.info"),
+            patch.object(
+                orchestrator, "_run_verification_command", side_effect=fake_command
+            ),
+            patch(
+                "code_team.orchestrator.orchestrator.CodeVerifier.run",
+                autospec=True,
+                side_effect=fake_run,
+            ) as mock_run,
+        ):
+            report = await orchestrator._run_verification(
+                Task(id="task-001", description="Test task")
+            )
+
+        # A single verifier keeps its Live panel
+        assert mock_run.call_args.kwargs["live"] is True
+        assert report == (
+            "## Automated Checks\n\n- **lint:** PASS"
+            "\n\n---\n\n## Verifier: Architecture\n\nPASS"
+        )
+
+    @pytest.mark.asyncio
+    async def test_slow_checks_time_out(self, orchestrator: Orchestrator) -> None:
+        """Test that a hung command or verifier is reported without stalling."""
+        python = shlex.quote(sys.executable)
+        orchestrator.config.verification.timeout_seconds = 0.2
+        orchestrator._active_verifiers = ["architecture", "security"]
+        orchestrator.config.verification.commands = [
+            VerificationCommand(
+                name="hangs", command=f"{python} -c 'import time; time.sleep(30)'"
+            )
+        ]
+
+        async def fake_run(self: Any, task: Task, prompt: str, live: bool) -> str:
+            if self.verifier_type == "security":
+                await asyncio.sleep(30)
+            return "PASS"
+
+        with (
+            patch("code_team.utils.git.get_git_diff", return_value=""),
+            patch("code_team.utils.ui.display.info"),
+            patch(
+                "code_team.orchestrator.orchestrator.CodeVerifier.run",
+                autospec=True,
+                side_effect=fake_run,
+            ),
+        ):
+            report = await asyncio.wait_for(
+                orchestrator._run_verification(
+                    Task(id="task-001", description="Test task")
+                ),
+                timeout=5,
+            )
+
+        assert "- **hangs:** TIMEOUT after 0.2s" in report
+        assert "## Verifier: Architecture\n\nPASS" in report
+        assert "## Verifier: Security\n\nTIMEOUT after 0.2s" in report
+
+    @pytest.mark.asyncio
+    async def test_verification_commands_run_as_subprocesses(
+        self, orchestrator: Orchestrator
+    ) -> None:
+        """Test command results, quoted arguments and launch errors."""
+        python = shlex.quote(sys.executable)
+        orchestrator._active_verifiers = []
+        orchestrator.config.verification.commands = [
+            VerificationCommand(name="ok", command=f"{python} -c 'print(1)'"),
+            VerificationCommand(
+                name="fails",
+                command=f"{python} -c \"raise SystemExit('bad output')\"",
+            ),
+            VerificationCommand(name="missing", command="no-such-command-xyz"),
+        ]
+
+        with (
+            patch("code_team.utils.git.get_git_diff", return_value=""),
+            patch("code_team.utils.ui.display.info"),
+        ):
+            report = await orchestrator._run_verification(
+                Task(id="task-001", description="Test task")
+            )
+
+        assert "- **ok:** PASS" in report
+        assert "- **fails:** FAIL" in report
+        assert "bad output" in report
+        assert "- **missing:** ERROR" in report
+
+    @pytest.mark.asyncio
+    async def test_command_output_is_bounded(self, orchestrator: Orchestrator) -> None:
+        """Test that only the tail of a failing command's output is reported."""
+        python = shlex.quote(sys.executable)
+        orchestrator.config.verification.commands = [
+            VerificationCommand(
+                name="noisy",
+                command=(
+                    f'{python} -c "[print(i) for i in range(10000)]; '
+                    f'raise SystemExit(1)"'
+                ),
+            )
+        ]
+
+        with (
+            patch("code_team.orchestrator.orchestrator._OUTPUT_TAIL_LINES", 3),
+            patch("code_team.utils.ui.display.info"),
+        ):
+            (report,) = await orchestrator._run_command_verifiers()
+
+        assert "- **noisy:** FAIL" in report
+        assert "[9997 earlier lines omitted]\n9997\n9998\n9999\n" in report
+
+
+class TestTaskScheduling:
+    """Test ready-task selection."""
+
+    def _plan(self) -> Plan:
+        return Plan(
+            plan_id="test-plan",
+            description="Test plan",
+            tasks=[
+                Task(id="task-001", description="First", status="completed"),
+                Task(id="task-002", description="Second", dependencies=["task-001"]),
+                Task(id="task-003", description="Third"),
+                Task(id="task-004", description="Fourth", dependencies=["task-002"]),
+            ],
+        )
+
+    def test_suggestion_counts_ready_tasks(self, orchestrator: Orchestrator) -> None:
+        """Test that the dashboard suggestion counts tasks the scheduler can start."""
+        suggestion = orchestrator._suggest_next_steps(
+            self._plan(), pending_count=3, failed_count=0
+        )
+
+        assert suggestion == "- Run 'codeteam code' to execute 2 ready task(s)"
+
+    def test_select_next_task(self, orchestrator: Orchestrator) -> None:
+        """Test that the first ready task is returned, or None when none is ready."""
+        plan = self._plan()
+        plan.tasks[2].status = "completed"
+
+        with patch("code_team.utils.ui.display.info"):
+            assert orchestrator._select_next_task(TaskScheduler(plan)) is plan.tasks[1]
+            plan.tasks[1].status = "failed"
+            assert orchestrator._select_next_task(TaskScheduler(plan)) is None
+
+
+class TestAgentReuse:
+    """Test that agents are created once per orchestrator."""
+
+    def test_get_agent_reuses_instance(self, orchestrator: Orchestrator) -> None:
+        """Test that each agent class is only instantiated once."""
+        with patch.object(
+            orchestrator, "_create_agent", side_effect=lambda cls: MagicMock()
+        ) as mock_create:
+            first = orchestrator._get_agent(Prompter)
+            second = orchestrator._get_agent(Prompter)
+            coder = orchestrator._get_agent(Coder)
+
+        assert first is second
+        assert coder is not first
+        assert mock_create.call_count == 2
+
+    def test_get_verifier_reuses_instance(self, orchestrator: Orchestrator) -> None:
+        """Test that each verifier type is only instantiated once."""
+        verifier = orchestrator._get_verifier("security")
+
+        assert verifier.verifier_type == "security"
+        assert orchestrator._get_verifier("security") is verifier
+        assert orchestrator._get_verifier("performance") is not verifier
+
+
+class TestClose:
+    """Test releasing session resources."""
+
+    def test_close_closes_the_response_cache(self, orchestrator: Orchestrator) -> None:
+        """Test that the response cache is closed on shutdown."""
+        orchestrator.llm_cache = MagicMock()
+
+        orchestrator.close()
+
+        orchestrator.llm_cache.close.assert_called_once_with()
+
+
+class TestGeneratedDirs:
+    """Test that generated files are kept out of task commits."""
+
+    def test_cache_dirs_are_gitignored(
+        self, orchestrator: Orchestrator, temp_project_root: tuple[Path, Path]
+    ) -> None:
+        """Test that the cache directories ignore everything in them."""
+        project_root, _ = temp_project_root
+
+        for cache_dir in ("cache", "jinja_cache"):
+            gitignore = project_root / ".codeteam" / cache_dir / ".gitignore"
+            assert gitignore.read_text() == "*\n"
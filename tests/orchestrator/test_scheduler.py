@@ -0,0 +1,81 @@
+"""Unit tests for the dependency-aware task scheduler."""
+
+from code_team.models.plan import Plan, Task
+from code_team.orchestrator.scheduler import TaskScheduler
+
+
+def _plan() -> Plan:
+    return Plan(
+        plan_id="test-plan",
+        description="Test plan",
+        tasks=[
+            Task(id="task-001", description="First"),
+            Task(id="task-002", description="Second", dependencies=["task-001"]),
+            Task(id="task-003", description="Third"),
+            Task(
+                id="task-004",
+                description="Fourth",
+                dependencies=["task-002", "task-003"],
+            ),
+        ],
+    )
+
+
+class TestTaskScheduler:
+    """Test the TaskScheduler class."""
+
+    def test_initial_ready_tasks(self) -> None:
+        """Test that only tasks without unmet dependencies start ready."""
+        scheduler = TaskScheduler(_plan())
+
+        assert [task.id for task in scheduler.ready_tasks()] == [
+            "task-001",
+            "task-003",
+        ]
+
+    def test_completing_tasks_releases_dependents_in_plan_order(self) -> None:
+        """Test that a task becomes ready once its last dependency completes."""
+        plan = _plan()
+        scheduler = TaskScheduler(plan)
+        order = []
+
+        while (task := scheduler.next_task()) is not None:
+            order.append(task.id)
+            task.status = "completed"
+            scheduler.mark_completed(task)
+
+        assert order == ["task-001", "task-002", "task-003", "task-004"]
+        assert scheduler.completed_ids == {task.id for task in plan.tasks}
+
+    def test_existing_statuses_are_respected(self) -> None:
+        """Test that completed tasks satisfy dependencies from the start."""
+        plan = _plan()
+        plan.tasks[0].status = "completed"
+        plan.tasks[2].status = "completed"
+
+        scheduler = TaskScheduler(plan)
+
+        assert [task.id for task in scheduler.ready_tasks()] == ["task-002"]
+        assert scheduler.completed_ids == {"task-001", "task-003"}
+
+    def test_failed_task_blocks_dependents(self) -> None:
+        """Test that a failed task is skipped and its dependents never run."""
+        plan = _plan()
+        scheduler = TaskScheduler(plan)
+        plan.tasks[0].status = "failed"
+
+        assert scheduler.next_task() is plan.tasks[2]
+        plan.tasks[2].status = "completed"
+        scheduler.mark_completed(plan.tasks[2])
+
+        assert scheduler.next_task() is None
+
+    def test_unknown_dependency_is_never_ready(self) -> None:
+        """Test that a dependency missing from the plan keeps a task blocked."""
+        plan = Plan(
+            plan_id="test-plan",
+            description="Test plan",
+            tasks=[Task(id="task-001", description="First", dependencies=["ghost"])],
+        )
+
+        assert TaskScheduler(plan).next_task() is None
@@ -1,10 +1,12 @@
 """Unit tests for CLI entry point."""
 
+import subprocess
+import sys
 from unittest.mock import MagicMock, patch
 
 import typer.testing
 
-from code_team.__main__ import app, main
+from code_team.__main__ import _install_uvloop, app, main
 
 
 class TestMainEntryPoint:
@@ -43,3 +45,40 @@ class TestMainEntryPoint:
 
         assert result.exit_code == 0
         assert "Start or resume the coding and verification loop" in result.stdout
+
+    def test_cli_import_defers_orchestrator(self) -> None:
+        """Test that importing the CLI does not load the orchestrator stack."""
+        code = "import sys, code_team.__main__; print('claude_code_sdk' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
+
+    def test_package_exposes_orchestrator_lazily(self) -> None:
+        """Test that code_team.Orchestrator still resolves on access."""
+        import code_team
+        from code_team.orchestrator.orchestrator import Orchestrator
+
+        assert code_team.Orchestrator is Orchestrator
+
+    @patch("code_team.__main__.asyncio.set_event_loop_policy")
+    def test_install_uvloop_skipped_on_windows(
+        self, mock_set_policy: MagicMock
+    ) -> None:
+        """Test that the default event loop is kept on Windows."""
+        with patch("code_team.__main__.sys.platform", "win32"):
+            _install_uvloop()
+
+        mock_set_policy.assert_not_called()
+
+    @patch("code_team.__main__.asyncio.set_event_loop_policy")
+    def test_install_uvloop_without_package(self, mock_set_policy: MagicMock) -> None:
+        """Test that a missing uvloop falls back to the default event loop."""
+        with (
+            patch("code_team.__main__.sys.platform", "linux"),
+            patch.dict(sys.modules, {"uvloop": None}),
+        ):
+            _install_uvloop()
+
+        mock_set_policy.assert_not_called()
@@ -4,15 +4,22 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
 import yaml
 
 from code_team.models.plan import Plan, Task
 from code_team.utils.filesystem import (
+    RepoMap,
+    ensure_ignored_dir,
     get_repo_map,
     load_plan,
+    parse_yaml,
     read_file,
+    read_file_async,
+    record_task_status,
     save_plan,
     write_file,
+    write_file_async,
 )
 
 
@@ -73,6 +80,44 @@ class TestWriteFile:
             assert file_path.read_text() == content
 
 
+class TestEnsureIgnoredDir:
+    """Test the ensure_ignored_dir function."""
+
+    def test_creates_directory_ignoring_everything(self) -> None:
+        """Test that the directory is created with a catch-all .gitignore."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir) / ".codeteam" / "cache"
+
+            ensure_ignored_dir(cache_dir)
+
+            assert (cache_dir / ".gitignore").read_text() == "*\n"
+
+    def test_existing_gitignore_is_kept(self) -> None:
+        """Test that an existing .gitignore is not overwritten."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir)
+            (cache_dir / ".gitignore").write_text("*.db\n")
+
+            ensure_ignored_dir(cache_dir)
+
+            assert (cache_dir / ".gitignore").read_text() == "*.db\n"
+
+
+class TestAsyncFileAccess:
+    """Test the threaded read_file_async and write_file_async wrappers."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self) -> None:
+        """Test writing and reading a file without blocking the event loop."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = Path(tmpdir) / "nested" / "report.md"
+
+            await write_file_async(file_path, "Report content")
+
+            assert await read_file_async(file_path) == "Report content"
+            assert await read_file_async(Path(tmpdir) / "missing.md") is None
+
+
 class TestReadFile:
     """Test the read_file function."""
 
@@ -194,6 +239,49 @@ class TestGetRepoMap:
             assert file_line.startswith("        |-- ")
 
 
+class TestRepoMap:
+    """Test the RepoMap cache."""
+
+    def test_unchanged_tree_is_not_rescanned(self, tmp_path: Path) -> None:
+        """Test that the last scan is reused while no directory changes."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "app.py").write_text("content")
+        repo_map = RepoMap(tmp_path)
+
+        first = repo_map.get()
+        with patch("code_team.utils.filesystem.os.scandir") as mock_scandir:
+            second = repo_map.get()
+
+        assert second is first
+        mock_scandir.assert_not_called()
+
+    def test_change_in_nested_directory_triggers_rescan(self, tmp_path: Path) -> None:
+        """Test that adding a file anywhere in the tree is picked up."""
+        (tmp_path / "src").mkdir()
+        repo_map = RepoMap(tmp_path)
+        assert "new.py" not in repo_map.get()
+
+        (tmp_path / "src" / "new.py").write_text("content")
+
+        assert repo_map.get() == get_repo_map(tmp_path)
+        assert "new.py" in repo_map.get()
+
+
+class TestParseYaml:
+    """Test the parse_yaml function."""
+
+    def test_matches_safe_load(self) -> None:
+        """Test that parsing gives the same result as yaml.safe_load."""
+        content = "name: test\nitems:\n  - 1\n  - two\nnested: {a: true}\n"
+
+        assert parse_yaml(content) == yaml.safe_load(content)
+
+    def test_rejects_unsafe_tags(self) -> None:
+        """Test that arbitrary Python objects are not constructed."""
+        with pytest.raises(yaml.YAMLError):
+            parse_yaml("!!python/object/apply:os.system ['true']")
+
+
 class TestLoadPlan:
     """Test the load_plan function."""
 
@@ -336,3 +424,109 @@ class TestSavePlan:
             assert loaded_plan is not None
             assert len(loaded_plan.tasks) == 1
             assert loaded_plan.tasks[0].id == "new"
+
+    def test_interrupted_save_keeps_previous_plan(self) -> None:
+        """Test that a failed save leaves the existing plan.yml untouched."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plan_path = Path(tmpdir) / "plan.yml"
+            plan = Plan(
+                plan_id="test-plan",
+                description="Test plan",
+                tasks=[Task(id="task-1", description="First task")],
+            )
+            save_plan(plan_path, plan)
+            original = plan_path.read_text()
+
+            plan.tasks[0].status = "completed"
+            with (
+                patch("code_team.utils.filesystem.os.replace", side_effect=OSError),
+                pytest.raises(OSError),
+            ):
+                save_plan(plan_path, plan)
+
+            assert plan_path.read_text() == original
+
+
+class TestTaskStatusJournal:
+    """Test journaling task statuses next to the plan."""
+
+    def _save(self, plan_path: Path) -> Plan:
+        plan = Plan(
+            plan_id="journal-plan",
+            description="Journal plan",
+            tasks=[
+                Task(id="task-1", description="First"),
+                Task(id="task-2", description="Second"),
+            ],
+        )
+        save_plan(plan_path, plan)
+        return plan
+
+    def test_journaled_status_is_replayed(self) -> None:
+        """Test that load_plan applies the latest journaled status per task."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plan_path = Path(tmpdir) / "plan.yml"
+            plan = self._save(plan_path)
+            base_content = plan_path.read_text()
+
+            plan.tasks[0].status = "failed"
+            record_task_status(plan_path, plan.tasks[0])
+            plan.tasks[0].status = "completed"
+            record_task_status(plan_path, plan.tasks[0])
+
+            assert plan_path.read_text() == base_content
+            loaded_plan = load_plan(plan_path)
+            assert loaded_plan is not None
+            assert [task.status for task in loaded_plan.tasks] == [
+                "completed",
+                "pending",
+            ]
+
+    def test_torn_journal_line_is_ignored(self) -> None:
+        """Test that a partially written journal line does not break loading."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plan_path = Path(tmpdir) / "plan.yml"
+            plan = self._save(plan_path)
+            plan.tasks[1].status = "completed"
+            record_task_status(plan_path, plan.tasks[1])
+            with (plan_path.parent / "status.jsonl").open("a") as f:
+                f.write('{"task_id": "task-1", "sta')
+
+            loaded_plan = load_plan(plan_path)
+            assert loaded_plan is not None
+            assert [task.status for task in loaded_plan.tasks] == [
+                "pending",
+                "completed",
+            ]
+
+    def test_save_plan_folds_in_journal(self) -> None:
+        """Test that saving the plan clears the journal it supersedes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plan_path = Path(tmpdir) / "plan.yml"
+            plan = self._save(plan_path)
+            plan.tasks[0].status = "completed"
+            record_task_status(plan_path, plan.tasks[0])
+
+            save_plan(plan_path, plan)
+
+            assert not (plan_path.parent / "status.jsonl").exists()
+            loaded_plan = load_plan(plan_path)
+            assert loaded_plan is not None
+            assert loaded_plan.tasks[0].status == "completed"
+
+    def test_long_journal_is_compacted_on_load(self) -> None:
+        """Test that load_plan folds an oversized journal into plan.yml."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plan_path = Path(tmpdir) / "plan.yml"
+            plan = self._save(plan_path)
+            plan.tasks[0].status = "completed"
+            for _ in range(3):
+                record_task_status(plan_path, plan.tasks[0])
+
+            with patch("code_team.utils.filesystem._JOURNAL_COMPACT_LINES", 2):
+                loaded_plan = load_plan(plan_path)
+
+            assert loaded_plan is not None
+            assert loaded_plan.tasks[0].status == "completed"
+            assert not (plan_path.parent / "status.jsonl").exists()
+            assert "status: completed" in plan_path.read_text()
@@ -1,13 +1,21 @@
 """Unit tests for LLM utilities."""
 
+import asyncio
 from collections.abc import AsyncIterator
 from unittest.mock import Mock, patch
 
 import pytest
-from claude_code_sdk import AssistantMessage, Message, TextBlock
+from claude_code_sdk import (
+    AssistantMessage,
+    Message,
+    ResultMessage,
+    TextBlock,
+    ToolUseBlock,
+)
 
 from code_team.models.config import LLMConfig
 from code_team.utils.llm import LLMProvider
+from code_team.utils.llm_cache import LLMCache, MemoryCacheBackend
 
 
 class TestLLMProvider:
@@ -192,3 +200,133 @@ class TestLLMProvider:
                 pass
 
         assert "SDK Error" in str(exc_info.value)
+
+
+class TestLLMProviderCachedQuery:
+    """Test the cached_query method of LLMProvider."""
+
+    @pytest.mark.asyncio
+    @patch("code_team.utils.llm.query")
+    async def test_cached_query_without_cache_delegates(self, mock_query: Mock) -> None:
+        """Test that cached_query streams directly when no cache is configured."""
+
+        async def mock_messages() -> AsyncIterator[Message]:
+            yield AssistantMessage(content=[TextBlock(text="Live")])
+
+        mock_query.return_value = mock_messages()
+        provider = LLMProvider(LLMConfig(), "/test/path")
+
+        messages = [m async for m in provider.cached_query("Prompt", "System")]
+
+        assert len(messages) == 1
+        mock_query.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("code_team.utils.llm.query")
+    async def test_query_text_yields_only_text(self, mock_query: Mock) -> None:
+        """Test that query_text drops tool calls and result messages."""
+
+        async def mock_messages() -> AsyncIterator[Message]:
+            yield AssistantMessage(
+                content=[
+                    TextBlock(text="Hello "),
+                    ToolUseBlock(id="tool-1", name="Read", input={}),
+                    TextBlock(text="world"),
+                ]
+            )
+            yield ResultMessage(
+                subtype="success",
+                duration_ms=1,
+                duration_api_ms=1,
+                is_error=False,
+                num_turns=1,
+                session_id="session",
+            )
+
+        mock_query.return_value = mock_messages()
+        cache = LLMCache(MemoryCacheBackend())
+        provider = LLMProvider(LLMConfig(), "/test/path", cache=cache)
+
+        texts = [text async for text in provider.query_text("Prompt", "System")]
+
+        assert texts == ["Hello ", "world"]
+        # The response cache is neither consulted nor filled
+        assert cache.stats == {"hits": 0, "misses": 0}
+
+    @pytest.mark.asyncio
+    @patch("code_team.utils.llm.query")
+    async def test_cached_query_replays_hit(self, mock_query: Mock) -> None:
+        """Test that a repeated request is served from the cache."""
+
+        async def mock_messages() -> AsyncIterator[Message]:
+            yield AssistantMessage(content=[TextBlock(text="Hello ")])
+            yield AssistantMessage(content=[TextBlock(text="world")])
+
+        mock_query.return_value = mock_messages()
+        cache = LLMCache(MemoryCacheBackend())
+        provider = LLMProvider(LLMConfig(), "/test/path", cache=cache)
+
+        [m async for m in provider.cached_query("Prompt", "System")]
+        replayed = [m async for m in provider.cached_query("Prompt", "System")]
+
+        mock_query.assert_called_once()
+        assert cache.stats == {"hits": 1, "misses": 1}
+        assert isinstance(replayed[0], AssistantMessage)
+        assert isinstance(replayed[0].content[0], TextBlock)
+        assert replayed[0].content[0].text == "Hello world"
+        assert isinstance(replayed[1], ResultMessage)
+        assert not replayed[1].is_error
+
+    @pytest.mark.asyncio
+    @patch("code_team.utils.llm.query")
+    async def test_cached_query_skips_error_results(self, mock_query: Mock) -> None:
+        """Test that responses ending in an error result are not cached."""
+
+        async def mock_messages() -> AsyncIterator[Message]:
+            yield AssistantMessage(content=[TextBlock(text="Partial")])
+            yield ResultMessage(
+                subtype="error_during_execution",
+                duration_ms=1,
+                duration_api_ms=1,
+                is_error=True,
+                num_turns=1,
+                session_id="test",
+            )
+
+        mock_query.side_effect = lambda **kwargs: mock_messages()
+        cache = LLMCache(MemoryCacheBackend())
+        provider = LLMProvider(LLMConfig(), "/test/path", cache=cache)
+
+        [m async for m in provider.cached_query("Prompt", "System")]
+        [m async for m in provider.cached_query("Prompt", "System")]
+
+        assert mock_query.call_count == 2
+        assert cache.stats == {"hits": 0, "misses": 2}
+
+    @pytest.mark.asyncio
+    @patch("code_team.utils.llm.query")
+    async def test_cached_query_coalesces_concurrent_requests(
+        self, mock_query: Mock
+    ) -> None:
+        """Test that identical in-flight requests share a single SDK call."""
+
+        async def mock_messages() -> AsyncIterator[Message]:
+            await asyncio.sleep(0.01)
+            yield AssistantMessage(content=[TextBlock(text="Shared")])
+
+        mock_query.side_effect = lambda **kwargs: mock_messages()
+        provider = LLMProvider(
+            LLMConfig(), "/test/path", cache=LLMCache(MemoryCacheBackend())
+        )
+
+        async def collect() -> list[Message]:
+            return [m async for m in provider.cached_query("Prompt", "System")]
+
+        first, second = await asyncio.gather(collect(), collect())
+
+        mock_query.assert_called_once()
+        for messages in (first, second):
+            assert isinstance(messages[0], AssistantMessage)
+            assert isinstance(messages[0].content[0], TextBlock)
+            assert messages[0].content[0].text == "Shared"
+        assert provider._in_flight == {}
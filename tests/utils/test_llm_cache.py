@@ -0,0 +1,200 @@
+"""Unit tests for the LLM response cache."""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from code_team.utils.llm_cache import (
+    JSONFileCacheBackend,
+    LLMCache,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+    TieredCacheBackend,
+    _canonical_json,
+    cache_key,
+)
+
+
+class TestCacheKey:
+    """Test the cache_key function."""
+
+    def test_key_is_deterministic(self) -> None:
+        """Test that identical requests produce identical keys."""
+        messages = [{"role": "user", "content": "Hello"}]
+        assert cache_key("sonnet", messages) == cache_key("sonnet", messages)
+
+    def test_key_ignores_tool_order(self) -> None:
+        """Test that tool ordering does not affect the key."""
+        messages = [{"role": "user", "content": "Hello"}]
+        assert cache_key("sonnet", messages, ["Read", "Bash"]) == cache_key(
+            "sonnet", messages, ["Bash", "Read"]
+        )
+
+    def test_key_changes_with_inputs(self) -> None:
+        """Test that model, messages and tools all participate in the key."""
+        messages = [{"role": "user", "content": "Hello"}]
+        base = cache_key("sonnet", messages)
+        assert cache_key("opus", messages) != base
+        assert cache_key("sonnet", [{"role": "user", "content": "Bye"}]) != base
+        assert cache_key("sonnet", messages, ["Read"]) != base
+
+
+class TestMemoryCacheBackend:
+    """Test the in-memory LRU backend."""
+
+    def test_set_and_get(self) -> None:
+        """Test storing and retrieving a value."""
+        backend = MemoryCacheBackend()
+        backend.set("key", "value")
+        assert backend.get("key") == "value"
+        assert backend.get("missing") is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test that the oldest untouched entry is evicted when full."""
+        backend = MemoryCacheBackend(maxsize=2)
+        backend.set("a", "1")
+        backend.set("b", "2")
+        backend.get("a")
+        backend.set("c", "3")
+
+        assert backend.get("a") == "1"
+        assert backend.get("b") is None
+        assert backend.get("c") == "3"
+
+    def test_expired_entries_are_dropped(self) -> None:
+        """Test that entries past their TTL are not returned."""
+        backend = MemoryCacheBackend()
+        with patch("code_team.utils.llm_cache.time.time", return_value=1000.0):
+            backend.set("key", "value", ttl=10)
+        with patch("code_team.utils.llm_cache.time.time", return_value=1011.0):
+            assert backend.get("key") is None
+
+
+class TestJSONFileCacheBackend:
+    """Test the on-disk JSON backend."""
+
+    def test_round_trip(self) -> None:
+        """Test that values persist across backend instances."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir) / "cache"
+            JSONFileCacheBackend(cache_dir).set("key", "value", ttl=60)
+
+            assert JSONFileCacheBackend(cache_dir).get("key") == "value"
+
+    def test_expired_entry_is_removed(self) -> None:
+        """Test that an expired entry is deleted on read."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir)
+            backend = JSONFileCacheBackend(cache_dir)
+            with patch("code_team.utils.llm_cache.time.time", return_value=1000.0):
+                backend.set("key", "value", ttl=10)
+            with patch("code_team.utils.llm_cache.time.time", return_value=1011.0):
+                assert backend.get("key") is None
+            assert not (cache_dir / "key.json").exists()
+
+    def test_corrupt_entry_is_a_miss(self) -> None:
+        """Test that unreadable cache files are treated as misses."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir)
+            (cache_dir / "key.json").write_text("not json")
+
+            assert JSONFileCacheBackend(cache_dir).get("key") is None
+
+
+class TestSQLiteCacheBackend:
+    """Test the on-disk SQLite backend."""
+
+    def test_round_trip(self) -> None:
+        """Test that values persist across backend instances."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "cache" / "responses.db"
+            writer = SQLiteCacheBackend(path)
+            writer.set("key", "value", ttl=60)
+            writer.set("key", "newer", ttl=60)
+            writer.close()
+
+            reader = SQLiteCacheBackend(path)
+            assert reader.get("key") == "newer"
+            assert reader.get("missing") is None
+            reader.close()
+
+    def test_expired_entry_is_removed(self) -> None:
+        """Test that an expired entry is deleted on read."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            backend = SQLiteCacheBackend(Path(tmpdir) / "responses.db")
+            with patch("code_team.utils.llm_cache.time.time", return_value=1000.0):
+                backend.set("key", "value", ttl=10)
+            with patch("code_team.utils.llm_cache.time.time", return_value=1011.0):
+                assert backend.get("key") is None
+            assert backend.get("key") is None
+            backend.close()
+
+
+class TestTieredCacheBackend:
+    """Test chaining of cache backends."""
+
+    def test_hit_in_slow_tier_is_promoted(self) -> None:
+        """Test that a hit in a slower tier is copied to faster tiers."""
+        fast = MemoryCacheBackend()
+        slow = MemoryCacheBackend()
+        slow.set("key", "value")
+
+        tiered = TieredCacheBackend(fast, slow)
+
+        assert tiered.get("key") == "value"
+        assert fast.get("key") == "value"
+
+    def test_set_writes_all_tiers(self) -> None:
+        """Test that values are stored in every tier."""
+        fast = MemoryCacheBackend()
+        slow = MemoryCacheBackend()
+
+        TieredCacheBackend(fast, slow).set("key", "value")
+
+        assert fast.get("key") == "value"
+        assert slow.get("key") == "value"
+
+
+class TestLLMCache:
+    """Test the LLMCache facade."""
+
+    def test_stats_track_hits_and_misses(self) -> None:
+        """Test that lookups are counted."""
+        cache = LLMCache(MemoryCacheBackend())
+
+        assert cache.get("key") is None
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+
+        assert cache.stats == {"hits": 1, "misses": 1}
+
+    def test_close_closes_every_tier(self) -> None:
+        """Test that closing the cache closes the SQLite connection behind it."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sqlite_backend = SQLiteCacheBackend(Path(tmpdir) / "responses.db")
+            cache = LLMCache(TieredCacheBackend(MemoryCacheBackend(), sqlite_backend))
+            cache.set("key", "value")
+
+            cache.close()
+
+            assert sqlite_backend._connection is None
+
+
+class TestCanonicalJSON:
+    """Test the payload serializer used for cache keys."""
+
+    def test_fallback_matches_orjson(self) -> None:
+        """Test that keys are identical with and without orjson installed."""
+        orjson = pytest.importorskip("orjson")
+        payload = {
+            "model": "sonnet",
+            "messages": [{"role": "user", "content": 'Héllo\n\t"wörld" </>'}],
+            "tools": ["Bash", "Read"],
+        }
+
+        with patch("code_team.utils.llm_cache.orjson", None):
+            fallback = _canonical_json(payload)
+
+        assert fallback == orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
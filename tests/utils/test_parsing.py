@@ -273,3 +273,13 @@ echo "Hello"
 ```"""
         result2 = extract_code_block(text2, "bash")
         assert result2 == '#!/bin/bash\necho "Hello"'
+
+    def test_longer_backtick_run_does_not_close_block(self) -> None:
+        """Test that only a run of exactly three backticks closes a block."""
+        text = "```\nfirst\n````\nsecond\n```"
+        assert extract_code_block(text) == "first\n````\nsecond"
+
+    def test_many_unclosed_fences(self) -> None:
+        """Test that input full of unclosed fences is rejected."""
+        assert extract_code_block("```python\nx" * 10_000, "python") is None
+        assert extract_code_block("```\n`" * 10_000) is None
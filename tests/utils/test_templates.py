@@ -1,352 +1,444 @@
 """Unit tests for template utilities."""
 
-import tempfile
+import os
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 from jinja2 import TemplateNotFound
 
-from code_team.utils.templates import TemplateManager
+from code_team.utils.templates import HybridTemplateLoader, TemplateManager
+
+_GUIDELINES = {
+    "ARCHITECTURE_GUIDELINES.md": "Architecture content",
+    "CODING_GUIDELINES.md": "Coding content",
+    "AGENT_OBJECTIVITY.md": "Objectivity content",
+}
+
+_COMPLEX_TEMPLATE = """
+{% if items %}
+Items:
+{% for item in items %}
+- {{ item.name }}: {{ item.value }}
+{% endfor %}
+{% else %}
+No items found.
+{% endif %}
+"""
+
+_ITEMS = (
+    {"name": "Item1", "value": "Value1"},
+    {"name": "Item2", "value": "Value2"},
+)
+
+
+_GUIDELINE_BYTES = {
+    filename: content.encode() for filename, content in _GUIDELINES.items()
+}
+
+
+def _seed_guidelines(
+    template_dir: Path, contents: dict[str, str] | None = None
+) -> None:
+    """Write the default guideline files, with optional per-file contents."""
+    overrides = {
+        filename: content.encode() for filename, content in (contents or {}).items()
+    }
+    for filename, data in {**_GUIDELINE_BYTES, **overrides}.items():
+        (template_dir / filename).write_bytes(data)
+
+
+@pytest.fixture(scope="module")
+def shared_templates(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> tuple[TemplateManager, Path]:
+    """A seeded template directory and one manager shared by the render tests.
+
+    Tests using it write uniquely named templates, so they do not interfere.
+    """
+    template_dir = tmp_path_factory.mktemp("templates")
+    _seed_guidelines(template_dir)
+    return TemplateManager(template_dir), template_dir
 
 
 class TestTemplateManager:
     """Test the TemplateManager class."""
 
     def test_initialization(self) -> None:
-        """Test TemplateManager initialization."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            template_dir = Path(tmpdir)
-            manager = TemplateManager(template_dir)
-            assert manager._env is not None
-            assert manager._env.loader is not None
-            assert manager._project_root is None
+        """Test TemplateManager initialization without touching the file system."""
+        manager = TemplateManager(Path("/nonexistent-unused"))
+        assert isinstance(manager._env.loader, HybridTemplateLoader)
+        assert manager._project_root is None
 
     def test_render_simple_template(self) -> None:
         """Test rendering a simple template."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            template_dir = Path(tmpdir)
-
-            template_file = template_dir / "test.txt"
-            template_file.write_text("Hello {{ name }}!")
-
-            (template_dir / "ARCHITECTURE_GUIDELINES.md").write_text(
-                "Architecture content"
-            )
-            (template_dir / "CODING_GUIDELINES.md").write_text("Coding content")
-            (template_dir / "AGENT_OBJECTIVITY.md").write_text("Objectivity content")
+        manager = TemplateManager.from_mapping(
+            {"test.txt": "Hello {{ name }}!", **_GUIDELINES}
+        )
 
-            manager = TemplateManager(template_dir)
+        with patch.object(
+            manager, "_load_guideline", wraps=manager._load_guideline
+        ) as mock_load:
             result = manager.render("test.txt", name="World")
 
-            assert "Hello World!" in result
-
-    def test_render_with_guidelines_context(self) -> None:
+        assert "Hello World!" in result
+        # The template refers to no guideline, so none is loaded
+        mock_load.assert_not_called()
+
+    def test_included_templates_receive_guidelines(self) -> None:
+        """Test that guidelines reach templates pulled in with include."""
+        manager = TemplateManager.from_mapping(
+            {
+                "outer.txt": "{% include 'inner.txt' %}",
+                "inner.txt": "{{ CODING_GUIDELINES }}",
+                **_GUIDELINES,
+            }
+        )
+
+        assert manager.render("outer.txt") == "Coding content"
+
+    def test_render_with_guidelines_context(
+        self, shared_templates: tuple[TemplateManager, Path]
+    ) -> None:
         """Test that guidelines are loaded into template context."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            template_dir = Path(tmpdir)
-
-            template_file = template_dir / "test.txt"
-            template_file.write_text("Guidelines: {{ ARCHITECTURE_GUIDELINES }}")
+        manager, template_dir = shared_templates
+        (template_dir / "guidelines.txt").write_text(
+            "Guidelines: {{ ARCHITECTURE_GUIDELINES }}"
+        )
 
-            (template_dir / "ARCHITECTURE_GUIDELINES.md").write_text(
-                "Test architecture"
-            )
-            (template_dir / "CODING_GUIDELINES.md").write_text("Test coding")
-            (template_dir / "AGENT_OBJECTIVITY.md").write_text("Test objectivity")
+        result = manager.render("guidelines.txt")
 
-            manager = TemplateManager(template_dir)
-            result = manager.render("test.txt")
+        assert "Guidelines: Architecture content" in result
 
-            assert "Guidelines: Test architecture" in result
-
-    def test_render_missing_guideline_files(self) -> None:
+    def test_render_missing_guideline_files(self, tmp_path: Path) -> None:
         """Test rendering when guideline files are missing from both file system and package."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            template_dir = Path(tmpdir)
-
-            template_file = template_dir / "test.txt"
-            template_file.write_text("{{ UNKNOWN_GUIDELINE }}")
+        template_file = tmp_path / "test.txt"
+        template_file.write_text("{{ UNKNOWN_GUIDELINE }}")
 
-            # Use a custom guideline file that doesn't exist anywhere
-            manager = TemplateManager(
-                template_dir, guideline_files=["UNKNOWN_GUIDELINE.md"]
-            )
-            result = manager.render("test.txt")
+        # Use a custom guideline file that doesn't exist anywhere
+        manager = TemplateManager(tmp_path, guideline_files=["UNKNOWN_GUIDELINE.md"])
+        result = manager.render("test.txt")
 
-            assert "not found" in result
+        assert "not found" in result
 
-    def test_render_missing_template(self) -> None:
+    def test_render_missing_template(
+        self, shared_templates: tuple[TemplateManager, Path]
+    ) -> None:
         """Test rendering a non-existent template."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            template_dir = Path(tmpdir)
-            manager = TemplateManager(template_dir)
+        manager, _ = shared_templates
+
+        with pytest.raises(TemplateNotFound):
+            manager.render("nonexistent.txt")
+
+    @pytest.mark.parametrize(
+        ("items", "expected"),
+        [
+            (_ITEMS, ["- Item1: Value1", "- Item2: Value2"]),
+            ((), ["No items found."]),
+        ],
+        ids=["with-items", "without-items"],
+    )
+    def test_render_complex_template(
+        self, items: tuple[dict[str, str], ...], expected: list[str]
+    ) -> None:
+        """Test rendering a template with loops and conditions."""
+        manager = TemplateManager.from_mapping(
+            {"complex.txt": _COMPLEX_TEMPLATE, **_GUIDELINES}
+        )
 
-            with pytest.raises(TemplateNotFound):
-                manager.render("nonexistent.txt")
+        result = manager.render("complex.txt", items=items)
 
-    def test_render_complex_template(self) -> None:
-        """Test rendering a template with loops and conditions."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            template_dir = Path(tmpdir)
-
-            # Create a complex template
-            template_content = """
-            {% if items %}
-            Items:
-            {% for item in items %}
-            - {{ item.name }}: {{ item.value }}
-            {% endfor %}
-            {% else %}
-            No items found.
-            {% endif %}
-            """
-            template_file = template_dir / "complex.txt"
-            template_file.write_text(template_content)
-
-            # Create mock guideline files
-            for filename in [
-                "ARCHITECTURE_GUIDELINES.md",
-                "CODING_GUIDELINES.md",
-                "AGENT_OBJECTIVITY.md",
-            ]:
-                (template_dir / filename).write_text(f"Content of {filename}")
-
-            manager = TemplateManager(template_dir)
-
-            # Test with items
-            items = [
-                {"name": "Item1", "value": "Value1"},
-                {"name": "Item2", "value": "Value2"},
-            ]
-            result = manager.render("complex.txt", items=items)
-            assert "- Item1: Value1" in result
-            assert "- Item2: Value2" in result
-
-            # Test without items
-            result = manager.render("complex.txt", items=[])
-            assert "No items found." in result
+        for line in expected:
+            assert line in result
 
     def test_render_custom_context_overrides_guidelines(self) -> None:
         """Test that custom context can override guideline context."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            template_dir = Path(tmpdir)
+        manager = TemplateManager.from_mapping(
+            {"test.txt": "{{ ARCHITECTURE_GUIDELINES }}", **_GUIDELINES}
+        )
 
-            template_file = template_dir / "test.txt"
-            template_file.write_text("{{ ARCHITECTURE_GUIDELINES }}")
+        result = manager.render("test.txt", ARCHITECTURE_GUIDELINES="Override content")
 
-            # Create guideline file
-            (template_dir / "ARCHITECTURE_GUIDELINES.md").write_text("Original content")
-            (template_dir / "CODING_GUIDELINES.md").write_text("Coding content")
-            (template_dir / "AGENT_OBJECTIVITY.md").write_text("Objectivity content")
+        assert "Override content" in result
+        assert "Architecture content" not in result
 
-            manager = TemplateManager(template_dir)
-            result = manager.render(
-                "test.txt", ARCHITECTURE_GUIDELINES="Override content"
-            )
+    def test_load_guideline_exception_handling(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that _load_guideline handles exceptions gracefully."""
+        template_file = tmp_path / "test.txt"
+        template_file.write_text("{{ ARCHITECTURE_GUIDELINES }}")
 
-            assert "Override content" in result
-            assert "Original content" not in result
+        manager = TemplateManager(tmp_path)
+        monkeypatch.setattr(
+            manager,
+            "_load_guideline",
+            lambda filename: "Guideline file 'test.md' not found.",
+        )
 
-    def test_load_guideline_exception_handling(self) -> None:
-        """Test that _load_guideline handles exceptions gracefully."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            template_dir = Path(tmpdir)
+        result = manager.render("test.txt")
 
-            template_file = template_dir / "test.txt"
-            template_file.write_text("{{ ARCHITECTURE_GUIDELINES }}")
+        assert "not found" in result
 
-            manager = TemplateManager(template_dir)
+    def test_load_guideline_no_loader(self) -> None:
+        """Test _load_guideline when loader is None."""
+        manager = TemplateManager(Path("/nonexistent-unused"))
+        manager._loader = None  # type: ignore[assignment]
+        result = manager._load_guideline("test.md")
+        assert "not found" in result
 
-            with patch.object(manager, "_load_guideline") as mock_load:
-                mock_load.return_value = "Guideline file 'test.md' not found."
+    def test_guideline_is_read_once_while_unchanged(self, tmp_path: Path) -> None:
+        """Test that unchanged guideline files are served from the cache."""
+        (tmp_path / "test.txt").write_text("{{ NOTES }}")
+        guideline = tmp_path / "NOTES.md"
+        guideline.write_text("Version 1")
 
-                result = manager.render("test.txt")
+        manager = TemplateManager(tmp_path, guideline_files=["NOTES.md"])
+        with patch.object(
+            manager._loader, "get_source", wraps=manager._loader.get_source
+        ) as mock_get_source:
+            assert manager._load_guideline("NOTES.md") == "Version 1"
+            assert manager._load_guideline("NOTES.md") == "Version 1"
+        mock_get_source.assert_called_once()
 
-                assert "not found" in result
+        guideline.write_text("Version 2")
+        stat = guideline.stat()
+        os.utime(guideline, (stat.st_atime + 10, stat.st_mtime + 10))
 
-    def test_load_guideline_no_loader(self) -> None:
-        """Test _load_guideline when loader is None."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            template_dir = Path(tmpdir)
-            manager = TemplateManager(template_dir)
-            manager._loader = None  # type: ignore[assignment]
-            result = manager._load_guideline("test.md")
-            assert "not found" in result
-
-    def test_package_fallback_loading(self) -> None:
-        """Test that templates are loaded from package when not found in file system."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            template_dir = Path(tmpdir)
+        assert manager.render("test.txt") == "Version 2"
 
-            # Create a template that uses a guideline that only exists in package
-            template_file = template_dir / "test.txt"
-            template_file.write_text("{{ ARCHITECTURE_GUIDELINES }}")
+    def test_deleted_guideline_is_not_served_from_cache(self, tmp_path: Path) -> None:
+        """Test that a cached guideline removed from disk falls back to the package."""
+        (tmp_path / "test.txt").write_text("{{ ARCHITECTURE_GUIDELINES }}")
+        _seed_guidelines(tmp_path)
 
-            # Don't create the guideline file in the temp directory
-            manager = TemplateManager(template_dir)
-            result = manager.render("test.txt")
+        manager = TemplateManager(tmp_path)
+        assert manager.render("test.txt") == "Architecture content"
 
-            # Should load from package resources
-            assert "Architecture Guidelines" in result
-            assert "not found" not in result
+        (tmp_path / "ARCHITECTURE_GUIDELINES.md").unlink()
 
-    def test_file_system_priority(self) -> None:
-        """Test that file system templates take priority over package templates."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            template_dir = Path(tmpdir)
+        assert "Architecture Guidelines" in manager.render("test.txt")
+
+    def test_package_fallback_loading(self, tmp_path: Path) -> None:
+        """Test that templates are loaded from package when not found in file system."""
+        # Create a template that uses a guideline that only exists in package
+        template_file = tmp_path / "test.txt"
+        template_file.write_text("{{ ARCHITECTURE_GUIDELINES }}")
 
-            # Create a template and override guideline file
-            template_file = template_dir / "test.txt"
-            template_file.write_text("{{ ARCHITECTURE_GUIDELINES }}")
+        # Don't create the guideline file in the temp directory
+        manager = TemplateManager(tmp_path)
+        result = manager.render("test.txt")
 
-            # Create a custom guideline file that overrides the package one
-            (template_dir / "ARCHITECTURE_GUIDELINES.md").write_text(
-                "Custom File System Guidelines"
-            )
+        # Should load from package resources
+        assert "Architecture Guidelines" in result
+        assert "not found" not in result
 
-            # Create other required guidelines so they don't fall back to package
-            (template_dir / "CODING_GUIDELINES.md").write_text("Custom Coding")
-            (template_dir / "AGENT_OBJECTIVITY.md").write_text("Custom Objectivity")
+    def test_file_system_priority(
+        self, shared_templates: tuple[TemplateManager, Path]
+    ) -> None:
+        """Test that file system templates take priority over package templates."""
+        manager, template_dir = shared_templates
+        (template_dir / "priority.txt").write_text("{{ ARCHITECTURE_GUIDELINES }}")
 
-            manager = TemplateManager(template_dir)
-            result = manager.render("test.txt")
+        result = manager.render("priority.txt")
 
-            # Should use file system version
-            assert "Custom File System Guidelines" in result
-            assert "Architecture Guidelines" not in result
+        # Should use the seeded file system version
+        assert "Architecture content" in result
+        assert "Architecture Guidelines" not in result
 
-    def test_custom_guideline_files(self) -> None:
+    def test_custom_guideline_files(self, tmp_path: Path) -> None:
         """Test that custom guideline files can be configured."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            template_dir = Path(tmpdir)
-
-            template_file = template_dir / "test.txt"
-            template_file.write_text("{{ CUSTOM_GUIDELINE }}")
+        template_file = tmp_path / "test.txt"
+        template_file.write_text("{{ CUSTOM_GUIDELINE }}")
 
-            # Create custom guideline file
-            (template_dir / "CUSTOM_GUIDELINE.md").write_text("Custom Content")
+        # Create custom guideline file
+        (tmp_path / "CUSTOM_GUIDELINE.md").write_text("Custom Content")
 
-            manager = TemplateManager(
-                template_dir, guideline_files=["CUSTOM_GUIDELINE.md"]
-            )
-            result = manager.render("test.txt")
+        manager = TemplateManager(tmp_path, guideline_files=["CUSTOM_GUIDELINE.md"])
+        result = manager.render("test.txt")
 
-            assert "Custom Content" in result
+        assert "Custom Content" in result
 
-    def test_dynamic_repo_map_generation(self) -> None:
+    def test_dynamic_repo_map_generation(self, tmp_path: Path) -> None:
         """Test that repo map content is generated dynamically when project_root is provided."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            template_dir = Path(tmpdir)
-            project_root = Path(tmpdir) / "project"
-            project_root.mkdir()
+        project_root = tmp_path / "project"
+        project_root.mkdir()
 
-            # Create a simple project structure
-            (project_root / "file1.txt").write_text("content1")
-            (project_root / "subdir").mkdir()
-            (project_root / "subdir" / "file2.txt").write_text("content2")
+        # Create a simple project structure
+        (project_root / "file1.txt").write_text("content1")
+        (project_root / "subdir").mkdir()
+        (project_root / "subdir" / "file2.txt").write_text("content2")
 
-            template_file = template_dir / "test.txt"
-            template_file.write_text("{{ REPO_MAP }}")
+        template_file = tmp_path / "test.txt"
+        template_file.write_text("{{ REPO_MAP }}")
 
-            # Create required guideline files
-            (template_dir / "ARCHITECTURE_GUIDELINES.md").write_text("Architecture")
-            (template_dir / "CODING_GUIDELINES.md").write_text("Coding")
-            (template_dir / "AGENT_OBJECTIVITY.md").write_text("Objectivity")
+        _seed_guidelines(tmp_path)
 
-            manager = TemplateManager(template_dir, project_root=project_root)
-            result = manager.render("test.txt")
+        manager = TemplateManager(tmp_path, project_root=project_root)
+        result = manager.render("test.txt")
 
-            # Should contain the dynamically generated repo map
-            assert "file1.txt" in result
-            assert "subdir/" in result
-            assert "file2.txt" in result
+        # Should contain the dynamically generated repo map
+        assert "file1.txt" in result
+        assert "subdir/" in result
+        assert "file2.txt" in result
 
-    def test_no_repo_map_without_project_root(self) -> None:
+    def test_no_repo_map_without_project_root(
+        self, shared_templates: tuple[TemplateManager, Path]
+    ) -> None:
         """Test that REPO_MAP context is not available when project_root is not provided."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            template_dir = Path(tmpdir)
-
-            template_file = template_dir / "test.txt"
-            template_file.write_text("{{ REPO_MAP if REPO_MAP else 'No repo map' }}")
-
-            # Create required guideline files
-            (template_dir / "ARCHITECTURE_GUIDELINES.md").write_text("Architecture")
-            (template_dir / "CODING_GUIDELINES.md").write_text("Coding")
-            (template_dir / "AGENT_OBJECTIVITY.md").write_text("Objectivity")
+        manager, template_dir = shared_templates  # No project_root provided
+        (template_dir / "no_repo_map.txt").write_text(
+            "{{ REPO_MAP if REPO_MAP else 'No repo map' }}"
+        )
 
-            manager = TemplateManager(template_dir)  # No project_root provided
-            result = manager.render("test.txt")
+        result = manager.render("no_repo_map.txt")
 
-            # Should not have repo map content
-            assert "No repo map" in result
+        # Should not have repo map content
+        assert "No repo map" in result
 
-    def test_repo_map_with_custom_exclude_dirs(self) -> None:
+    def test_repo_map_with_custom_exclude_dirs(self, tmp_path: Path) -> None:
         """Test that custom exclude_dirs are properly used in repo map generation."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            template_dir = Path(tmpdir)
-            project_root = Path(tmpdir) / "project"
-            project_root.mkdir()
-
-            # Create a project structure with files to exclude
-            (project_root / "keep_file.txt").write_text("content")
-            (project_root / "exclude_dir").mkdir()
-            (project_root / "exclude_dir" / "hidden.txt").write_text("content")
-            (project_root / "another_exclude").mkdir()
-            (project_root / "another_exclude" / "also_hidden.txt").write_text("content")
-
-            template_file = template_dir / "test.txt"
-            template_file.write_text("{{ REPO_MAP }}")
-
-            # Create required guideline files
-            (template_dir / "ARCHITECTURE_GUIDELINES.md").write_text("Architecture")
-            (template_dir / "CODING_GUIDELINES.md").write_text("Coding")
-            (template_dir / "AGENT_OBJECTIVITY.md").write_text("Objectivity")
-
-            # Test with custom exclude_dirs
-            manager = TemplateManager(
-                template_dir,
-                project_root=project_root,
-                exclude_dirs=["exclude_dir", "another_exclude"],
-            )
-            result = manager.render("test.txt")
-
-            # Should contain the kept file but not the excluded directories
-            assert "keep_file.txt" in result
-            assert "exclude_dir" not in result
-            assert "another_exclude" not in result
-            assert "hidden.txt" not in result
-            assert "also_hidden.txt" not in result
-
-    def test_repo_map_with_default_exclude_dirs(self) -> None:
+        project_root = tmp_path / "project"
+        project_root.mkdir()
+
+        # Create a project structure with files to exclude
+        (project_root / "keep_file.txt").write_text("content")
+        (project_root / "exclude_dir").mkdir()
+        (project_root / "exclude_dir" / "hidden.txt").write_text("content")
+        (project_root / "another_exclude").mkdir()
+        (project_root / "another_exclude" / "also_hidden.txt").write_text("content")
+
+        template_file = tmp_path / "test.txt"
+        template_file.write_text("{{ REPO_MAP }}")
+
+        _seed_guidelines(tmp_path)
+
+        # Test with custom exclude_dirs
+        manager = TemplateManager(
+            tmp_path,
+            project_root=project_root,
+            exclude_dirs=["exclude_dir", "another_exclude"],
+        )
+        result = manager.render("test.txt")
+
+        # Should contain the kept file but not the excluded directories
+        assert "keep_file.txt" in result
+        assert "exclude_dir" not in result
+        assert "another_exclude" not in result
+        assert "hidden.txt" not in result
+        assert "also_hidden.txt" not in result
+
+    def test_repo_map_with_default_exclude_dirs(self, tmp_path: Path) -> None:
         """Test that default exclude_dirs are used when none are specified."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            template_dir = Path(tmpdir)
-            project_root = Path(tmpdir) / "project"
-            project_root.mkdir()
-
-            # Create a project structure with default excluded directories
-            (project_root / "keep_file.txt").write_text("content")
-            (project_root / ".git").mkdir()
-            (project_root / ".git" / "config").write_text("content")
-            (project_root / "__pycache__").mkdir()
-            (project_root / "__pycache__" / "cache.pyc").write_text("content")
-
-            template_file = template_dir / "test.txt"
-            template_file.write_text("{{ REPO_MAP }}")
-
-            # Create required guideline files
-            (template_dir / "ARCHITECTURE_GUIDELINES.md").write_text("Architecture")
-            (template_dir / "CODING_GUIDELINES.md").write_text("Coding")
-            (template_dir / "AGENT_OBJECTIVITY.md").write_text("Objectivity")
-
-            # Test with no exclude_dirs specified (should use defaults)
-            manager = TemplateManager(template_dir, project_root=project_root)
-            result = manager.render("test.txt")
-
-            # Should contain the kept file but not the default excluded directories
-            assert "keep_file.txt" in result
-            assert ".git" not in result
-            assert "__pycache__" not in result
-            assert "config" not in result
-            assert "cache.pyc" not in result
+        project_root = tmp_path / "project"
+        project_root.mkdir()
+
+        # Create a project structure with default excluded directories
+        (project_root / "keep_file.txt").write_text("content")
+        (project_root / ".git").mkdir()
+        (project_root / ".git" / "config").write_text("content")
+        (project_root / "__pycache__").mkdir()
+        (project_root / "__pycache__" / "cache.pyc").write_text("content")
+
+        template_file = tmp_path / "test.txt"
+        template_file.write_text("{{ REPO_MAP }}")
+
+        _seed_guidelines(tmp_path)
+
+        # Test with no exclude_dirs specified (should use defaults)
+        manager = TemplateManager(tmp_path, project_root=project_root)
+        result = manager.render("test.txt")
+
+        # Should contain the kept file but not the default excluded directories
+        assert "keep_file.txt" in result
+        assert ".git" not in result
+        assert "__pycache__" not in result
+        assert "config" not in result
+        assert "cache.pyc" not in result
+
+    def test_render_is_memoized(self, tmp_path: Path) -> None:
+        """Test that identical renders reuse the cached result."""
+        (tmp_path / "test.txt").write_text("Hello {{ name }}!")
+
+        manager = TemplateManager(tmp_path, guideline_files=[])
+        first = manager.render("test.txt", name="World")
+        second = manager.render("test.txt", name="World")
+        other = manager.render("test.txt", name="There")
+
+        assert first == second == "Hello World!"
+        assert other == "Hello There!"
+        info = manager._render_cached.cache_info()
+        assert info.hits == 1
+        assert info.misses == 2
+
+    def test_render_picks_up_edited_template(self, tmp_path: Path) -> None:
+        """Test that a template edited on disk is not served from the cache."""
+        template_file = tmp_path / "test.txt"
+        template_file.write_text("Version 1")
+
+        manager = TemplateManager(tmp_path, guideline_files=[])
+        assert manager.render("test.txt") == "Version 1"
+
+        template_file.write_text("Version 2")
+        stat = template_file.stat()
+        os.utime(template_file, (stat.st_atime + 10, stat.st_mtime + 10))
+
+        assert manager.render("test.txt") == "Version 2"
+
+    def test_compiled_templates_are_cached(self, tmp_path: Path) -> None:
+        """Test that compiled templates are reused, even unchecked without reload."""
+        template_file = tmp_path / "test.txt"
+        template_file.write_text("Version 1")
+
+        manager = TemplateManager(tmp_path, guideline_files=[], auto_reload=False)
+        assert manager._env.cache is not None
+        assert manager._env.auto_reload is False
+        assert manager.render("test.txt") == "Version 1"
+
+        template_file.write_text("Version 2")
+        stat = template_file.stat()
+        os.utime(template_file, (stat.st_atime + 10, stat.st_mtime + 10))
+
+        assert manager.render("test.txt") == "Version 1"
+
+    def test_bytecode_cache_persists_compiled_templates(self, tmp_path: Path) -> None:
+        """Test that compiled templates are written to the bytecode cache."""
+        template_dir = tmp_path / "templates"
+        template_dir.mkdir()
+        (template_dir / "test.txt").write_text("Hello {{ name }}!")
+        cache_dir = tmp_path / "jinja_cache"
+        cache_dir.mkdir()
+
+        manager = TemplateManager(
+            template_dir, guideline_files=[], bytecode_cache_dir=cache_dir
+        )
+        assert manager.render("test.txt", name="World") == "Hello World!"
+        assert any(cache_dir.glob("*.cache"))
+
+        reloaded = TemplateManager(
+            template_dir, guideline_files=[], bytecode_cache_dir=cache_dir
+        )
+        assert reloaded.render("test.txt", name="Again") == "Hello Again!"
+
+    def test_construction_does_not_create_cache_dir(self, tmp_path: Path) -> None:
+        """Test that building a manager leaves the project tree untouched."""
+        cache_dir = tmp_path / "jinja_cache"
+
+        TemplateManager(tmp_path, guideline_files=[], bytecode_cache_dir=cache_dir)
+
+        assert not cache_dir.exists()
+
+    def test_precompile_loads_instruction_templates(self, tmp_path: Path) -> None:
+        """Test that precompile compiles every agent instruction template."""
+        (tmp_path / "notes.txt").write_text("Not an instruction")
+
+        manager = TemplateManager(tmp_path, guideline_files=[])
+        with patch.object(
+            manager._env, "get_template", wraps=manager._env.get_template
+        ) as mock_get_template:
+            manager.precompile()
+
+        loaded = {call.args[0] for call in mock_get_template.call_args_list}
+        assert "CODER_INSTRUCTIONS.md" in loaded
+        assert "PLANNER_INSTRUCTIONS.md" in loaded
+        assert "notes.txt" not in loaded
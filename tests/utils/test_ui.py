@@ -1,7 +1,11 @@
 """Unit tests for UI utilities (non-visual logic)."""
 
+import asyncio
+import io
+import threading
 from unittest.mock import Mock, call, patch
 
+import pytest
 from rich.console import Console
 from rich.live import Live
 from rich.panel import Panel
@@ -11,12 +15,26 @@ from code_team.utils.ui import (
     APP_THEME,
     DisplayManager,
     InteractiveManager,
+    ask_async,
     console,
     display,
+    escape_rich,
     interactive,
 )
 
 
+class TestEscapeRich:
+    """Test the escape_rich helper."""
+
+    def test_doubles_square_brackets(self) -> None:
+        """Test that markup brackets are escaped."""
+        assert escape_rich("[bold]x[/bold]") == "[[bold]]x[[/bold]]"
+
+    def test_leaves_plain_text_unchanged(self) -> None:
+        """Test that text without brackets is returned as-is."""
+        assert escape_rich("plain text") == "plain text"
+
+
 class TestDisplayManager:
     """Test the DisplayManager class."""
 
@@ -228,6 +246,18 @@ class TestDisplayManager:
 
         mock_console.print.assert_called_once_with()
 
+    def test_batch_defers_output_until_exit(self) -> None:
+        """Test that prints inside a batch reach the terminal together on exit."""
+        output = io.StringIO()
+        manager = DisplayManager(Console(file=output))
+
+        with manager.batch():
+            manager.print("first")
+            manager.print("second")
+            assert output.getvalue() == ""
+
+        assert output.getvalue() == "first\nsecond\n"
+
     def test_create_agent_panel(self) -> None:
         """Test that create_agent_panel returns a properly styled Panel."""
         manager = DisplayManager()
@@ -538,6 +568,32 @@ class TestInteractiveManager:
         assert mock_prompt.call_count == 4
 
 
+class TestAskAsync:
+    """Test the ask_async helper."""
+
+    @pytest.mark.asyncio
+    async def test_prompt_runs_off_the_event_loop(self) -> None:
+        """Test that other coroutines run while the prompt blocks."""
+        answered = threading.Event()
+        ticks = 0
+
+        def blocking_prompt(prompt_text: str, *, default: str) -> str:
+            answered.wait(timeout=5)
+            return f"{prompt_text}: {default}"
+
+        async def ticker() -> None:
+            nonlocal ticks
+            ticks += 1
+            answered.set()
+
+        result, _ = await asyncio.gather(
+            ask_async(blocking_prompt, "You", default="yes"), ticker()
+        )
+
+        assert result == "You: yes"
+        assert ticks == 1
+
+
 class TestTheme:
     """Test the application theme."""
 
@@ -0,0 +1,108 @@
+"""Unit tests for the parsed YAML cache."""
+
+import os
+import tempfile
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from code_team.models.plan import Plan, Task
+from code_team.utils import filesystem, yaml_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> Generator[None, None, None]:
+    """Start every test with an empty cache."""
+    yaml_cache.clear()
+    yield
+    yaml_cache.clear()
+
+
+def _touch(path: Path, content: str, mtime_ns: int) -> None:
+    path.write_text(content)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestLoadYaml:
+    """Test the load_yaml function."""
+
+    def test_unchanged_file_is_parsed_once(self) -> None:
+        """Test that repeated loads of an unchanged file reuse the parse."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "config.yml"
+            _touch(path, "llm:\n  planner: opus\n", 1_000_000_000)
+
+            with patch(
+                "code_team.utils.filesystem.parse_yaml", wraps=filesystem.parse_yaml
+            ) as mock_parse:
+                first = yaml_cache.load_yaml(path)
+                second = yaml_cache.load_yaml(path)
+
+            assert first == second == {"llm": {"planner": "opus"}}
+            mock_parse.assert_called_once()
+
+    def test_returns_independent_copies(self) -> None:
+        """Test that callers cannot modify the cached data."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "config.yml"
+            _touch(path, "items: [1, 2]\n", 1_000_000_000)
+
+            yaml_cache.load_yaml(path)["items"].append(3)
+
+            assert yaml_cache.load_yaml(path) == {"items": [1, 2]}
+
+    def test_changed_file_is_reparsed(self) -> None:
+        """Test that a new mtime or size invalidates the entry."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "config.yml"
+            _touch(path, "value: 1\n", 1_000_000_000)
+            yaml_cache.load_yaml(path)
+
+            _touch(path, "value: 2\n", 2_000_000_000)
+
+            assert yaml_cache.load_yaml(path) == {"value": 2}
+
+    def test_missing_file_raises(self) -> None:
+        """Test that a missing file raises FileNotFoundError."""
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            pytest.raises(FileNotFoundError),
+        ):
+            yaml_cache.load_yaml(Path(tmpdir) / "missing.yml")
+
+
+class TestLoadPlan:
+    """Test the cached load_plan function."""
+
+    def test_journaled_status_invalidates_entry(self) -> None:
+        """Test that a status change recorded in the journal is picked up."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plan_path = Path(tmpdir) / "plan.yml"
+            plan = Plan(
+                plan_id="plan-0001",
+                description="Test plan",
+                tasks=[Task(id="task-1", description="First")],
+            )
+            filesystem.save_plan(plan_path, plan)
+
+            first = yaml_cache.load_plan(plan_path)
+            assert first is not None
+            first.tasks[0].status = "failed"
+
+            cached = yaml_cache.load_plan(plan_path)
+            assert cached is not None
+            assert cached.tasks[0].status == "pending"
+
+            plan.tasks[0].status = "completed"
+            filesystem.record_task_status(plan_path, plan.tasks[0])
+
+            updated = yaml_cache.load_plan(plan_path)
+            assert updated is not None
+            assert updated.tasks[0].status == "completed"
+
+    def test_missing_plan(self) -> None:
+        """Test that a missing plan file yields None."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            assert yaml_cache.load_plan(Path(tmpdir) / "plan.yml") is None